@@ -0,0 +1,55 @@
+# benchmarks/bench_carregamento.py
+"""
+Mede as etapas da carga de um arquivo grande: leitura do JSON e construção
+das tarefas. A construção das tarefas é a etapa mais cara e precisa ocorrer
+no processo que as usa, por isso a carga não usa um pool de processos.
+
+Uso: python benchmarks/bench_carregamento.py [quantidade_de_tarefas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerenciador_tarefas.persistencia import decodificar_tarefas, escrever_json, ler_registros
+
+
+def gerar_registros(quantidade):
+    return [
+        {
+            "id": f"{i:08d}-0000-4000-8000-000000000000",
+            "descricao": f"Tarefa de benchmark {i}",
+            "data_vencimento": "2025-01-01" if i % 2 else None,
+            "concluida": i % 3 == 0,
+        }
+        for i in range(quantidade)
+    ]
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{quantidade} registros")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        arquivo = os.path.join(diretorio, "tarefas.json")
+        escrever_json(arquivo, gerar_registros(quantidade))
+
+        inicio = time.perf_counter()
+        registros, corrompidos = ler_registros(arquivo)
+        leitura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        validos, erros = decodificar_tarefas(registros)
+        construcao = time.perf_counter() - inicio
+
+    assert len(validos) == quantidade and not erros and not corrompidos
+    total = leitura + construcao
+    print(f"leitura do JSON:       {leitura:.3f}s ({leitura / total:.0%})")
+    print(f"construção das tarefas: {construcao:.3f}s ({construcao / total:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/bench_compressao.py
+"""
+Compara tamanho, tempo de gravação e tempo de leitura de cada formato de
+arquivo de tarefas.
+
+Uso: python benchmarks/bench_compressao.py [quantidade_de_tarefas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerenciador_tarefas.persistencia import FORMATOS, escrever_json, ler_registros
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    registros = [
+        {
+            "id": f"{i:08d}-0000-4000-8000-000000000000",
+            "descricao": f"Tarefa de benchmark {i}",
+            "data_vencimento": "2025-01-01" if i % 2 else None,
+            "concluida": i % 3 == 0,
+        }
+        for i in range(quantidade)
+    ]
+    print(f"{quantidade} registros")
+    print(f"{'formato':<8} {'tamanho (KiB)':>14} {'gravação (s)':>13} {'leitura (s)':>12}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        for formato in FORMATOS:
+            caminho = os.path.join(diretorio, f"tarefas.{formato}")
+
+            inicio = time.perf_counter()
+            escrever_json(caminho, registros, formato=formato)
+            gravacao = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            lidos, corrompidos = ler_registros(caminho)
+            leitura = time.perf_counter() - inicio
+            assert len(lidos) == quantidade and not corrompidos
+
+            tamanho = os.path.getsize(caminho) / 1024
+            print(f"{formato:<8} {tamanho:>14.0f} {gravacao:>13.3f} {leitura:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# benchmarks/bench_identificadores.py
+"""
+Compara quantos IDs por segundo cada esquema gera.
+
+Uso: python benchmarks/bench_identificadores.py [quantidade_de_ids]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerenciador_tarefas.identificadores import criar_gerador
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    for esquema in ("uuid4", "uuid7"):
+        gerar = criar_gerador(esquema)
+        inicio = time.perf_counter()
+        for _ in range(quantidade):
+            gerar()
+        decorrido = time.perf_counter() - inicio
+        print(f"{esquema}: {quantidade / decorrido:,.0f} IDs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_recuperacao.py
+"""
+Mede o tempo para recuperar um arquivo de tarefas grande danificado no meio.
+
+Uso: python benchmarks/bench_recuperacao.py [quantidade_de_tarefas]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerenciador_tarefas.persistencia import recuperar_registros
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    registros = [
+        {
+            "id": f"{i:08d}-0000-4000-8000-000000000000",
+            "descricao": f"Tarefa de benchmark {i}",
+            "data_vencimento": None,
+            "concluida": False,
+        }
+        for i in range(quantidade)
+    ]
+    texto = json.dumps(registros, indent=4, ensure_ascii=False)
+    meio = len(texto) // 2
+    texto = texto[:meio] + "\x00corrompido\x00" + texto[meio + 200:]
+
+    inicio = time.perf_counter()
+    recuperados, corrompidos = recuperar_registros(texto)
+    decorrido = time.perf_counter() - inicio
+    print(f"{len(recuperados)} de {quantidade} registros recuperados, "
+          f"{len(corrompidos)} trecho(s) corrompido(s) em {decorrido:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# gerenciador_tarefas/alteracoes.py
+
+import json
+import os
+
+# Tamanho do trecho lido do fim do arquivo para achar a última sequência
+_TAMANHO_CAUDA = 64 * 1024
+
+
+class FluxoDeAlteracoes:
+    """
+    Fluxo de eventos das alterações feitas nas tarefas.
+
+    Cada evento é um dicionário {"seq", "tipo", "tarefa"}, com "seq"
+    estritamente crescente. Os eventos são entregues aos assinantes do
+    mesmo processo e, opcionalmente, acrescentados a um arquivo (um JSON por
+    linha) que leitores externos podem acompanhar com ler_alteracoes.
+    """
+    TIPOS = ("adicionada", "concluida", "reaberta", "removida")
+
+    def __init__(self, arquivo=None):
+        """
+        Inicializa o fluxo de alterações.
+
+        Args:
+            arquivo (str, optional): Arquivo onde os eventos são registrados.
+                                     Se existir, a numeração continua de onde parou.
+                                     Defaults to None (apenas em memória).
+        """
+        self.arquivo = arquivo
+        self._assinantes = []
+        self.ultima_sequencia = _ultima_sequencia(arquivo) if arquivo else 0
+
+    def assinar(self, callback):
+        """
+        Registra uma função chamada com cada novo evento.
+
+        Args:
+            callback (callable): Função que recebe o evento (dict).
+
+        Returns:
+            callable: O próprio callback, para uso em cancelar_assinatura.
+        """
+        self._assinantes.append(callback)
+        return callback
+
+    def cancelar_assinatura(self, callback):
+        """
+        Remove um assinante registrado.
+
+        Returns:
+            bool: True se o assinante foi removido, False se não estava registrado.
+        """
+        if callback in self._assinantes:
+            self._assinantes.remove(callback)
+            return True
+        return False
+
+    def publicar(self, tipo, tarefa):
+        """
+        Registra e distribui um evento de alteração.
+
+        Args:
+            tipo (str): Um dos valores de TIPOS.
+            tarefa (Tarefa): A tarefa alterada (no estado após a alteração).
+
+        Returns:
+            dict: O evento publicado.
+        """
+        if tipo not in self.TIPOS:
+            raise ValueError(f"Tipo de alteração inválido: {tipo}")
+        self.ultima_sequencia += 1
+        evento = {"seq": self.ultima_sequencia, "tipo": tipo, "tarefa": tarefa.to_dict()}
+
+        if self.arquivo:
+            try:
+                with open(self.arquivo, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(evento, ensure_ascii=False) + "\n")
+            except IOError as e:
+                print(f"Erro ao registrar alteração no arquivo {self.arquivo}: {e}")
+
+        for callback in list(self._assinantes):
+            try:
+                callback(evento)
+            except Exception as e: # Um assinante com erro não deve impedir os demais
+                print(f"Erro no assinante {callback!r}: {e}")
+        return evento
+
+
+def _interpretar_linha(linha):
+    """
+    Converte uma linha do arquivo em evento.
+
+    Returns:
+        dict or None: O evento, ou None se a linha não for um objeto JSON com
+                      "seq" inteiro (ex.: linha incompleta ou valor solto como 5).
+    """
+    try:
+        evento = json.loads(linha)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(evento, dict) or not isinstance(evento.get("seq"), int):
+        return None
+    return evento
+
+
+def _posicao_apos_sequencia(f, tamanho, a_partir_de):
+    """
+    Busca binária pelo início de uma linha anterior ou igual à do primeiro
+    evento com seq maior que a_partir_de. Como "seq" cresce ao longo do
+    arquivo, cada passo descarta metade dos bytes restantes.
+
+    Args:
+        f: Arquivo aberto em modo binário.
+        tamanho (int): Tamanho do arquivo em bytes.
+        a_partir_de (int): A sequência procurada.
+
+    Returns:
+        int: Posição (início de linha) a partir da qual a leitura deve começar.
+    """
+    baixo, alto = 0, tamanho
+    while baixo < alto:
+        meio = (baixo + alto) // 2
+        # Alinha no início da primeira linha que começa em meio ou depois
+        f.seek(meio - 1 if meio else 0)
+        if meio:
+            f.readline()
+        evento = None
+        while evento is None and f.tell() < alto:
+            evento = _interpretar_linha(f.readline())
+        if evento is not None and evento["seq"] <= a_partir_de:
+            baixo = f.tell() # Logo após uma linha que ainda não interessa
+        else:
+            alto = meio
+    return baixo
+
+
+def ler_alteracoes(arquivo, a_partir_de=0):
+    """
+    Lê os eventos registrados em um arquivo de alterações.
+
+    Com a_partir_de, localiza o ponto de partida por busca binária em vez
+    de reler o arquivo desde o início, então acompanhar o arquivo custa
+    O(log n) mais os eventos novos. Linhas incompletas (ex.: gravação
+    interrompida) ou que não são eventos são ignoradas.
+
+    Args:
+        arquivo (str): Arquivo de eventos.
+        a_partir_de (int, optional): Retorna apenas eventos com seq maior que este
+                                     valor. Defaults to 0 (todos).
+
+    Yields:
+        dict: Os eventos, em ordem de sequência.
+    """
+    if not os.path.exists(arquivo):
+        return
+    with open(arquivo, "rb") as f:
+        if a_partir_de > 0:
+            f.seek(0, os.SEEK_END)
+            f.seek(_posicao_apos_sequencia(f, f.tell(), a_partir_de))
+        for linha in f:
+            evento = _interpretar_linha(linha)
+            if evento is not None and evento["seq"] > a_partir_de:
+                yield evento
+
+
+def _ultima_sequencia(arquivo):
+    """
+    Retorna a maior sequência registrada no arquivo, lendo apenas o seu final.
+    """
+    if not os.path.exists(arquivo):
+        return 0
+    with open(arquivo, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        tamanho = f.tell()
+        f.seek(max(0, tamanho - _TAMANHO_CAUDA))
+        linhas = f.read().decode("utf-8", errors="replace").splitlines()
+    for linha in reversed(linhas):
+        evento = _interpretar_linha(linha)
+        if evento is not None:
+            return evento["seq"]
+    # Nenhuma linha válida no final: percorre o arquivo inteiro
+    return max((evento["seq"] for evento in ler_alteracoes(arquivo)), default=0)
@@ -0,0 +1,184 @@
+# gerenciador_tarefas/identificadores.py
+
+import os
+import time
+from bisect import bisect_left
+import uuid
+from datetime import datetime, timezone
+
+# Bytes aleatórios lidos do sistema operacional de uma só vez
+_TAMANHO_BUFFER = 8 * 1024
+
+_MASCARA_62_BITS = (1 << 62) - 1
+_MAXIMO_CONTADOR = 0xFFF
+
+
+def gerar_uuid4():
+    """Gera um ID aleatório (UUID versão 4), o esquema original das tarefas."""
+    return str(uuid.uuid4())
+
+
+class GeradorUUIDv7:
+    """
+    Gera IDs no formato UUID versão 7: os 48 primeiros bits são o instante
+    de criação em milissegundos, então os IDs ordenam pela data de criação.
+
+    Os bits aleatórios vêm de um buffer preenchido com os.urandom em blocos,
+    em vez de uma leitura do sistema operacional por ID. Dentro do mesmo
+    milissegundo, um contador de 12 bits garante IDs sempre crescentes.
+    """
+    def __init__(self, tamanho_buffer=_TAMANHO_BUFFER):
+        """
+        Inicializa o gerador.
+
+        Args:
+            tamanho_buffer (int, optional): Bytes aleatórios lidos por vez.
+        """
+        self._tamanho_buffer = tamanho_buffer
+        self._buffer = b""
+        self._posicao = 0
+        self._ultimo_ms = -1
+        self._contador = 0
+
+    def _aleatorio(self, tamanho=8):
+        """Retorna os próximos bytes aleatórios do buffer, como inteiro."""
+        if self._posicao + tamanho > len(self._buffer):
+            self._buffer = os.urandom(max(self._tamanho_buffer, tamanho))
+            self._posicao = 0
+        inicio = self._posicao
+        self._posicao += tamanho
+        return int.from_bytes(self._buffer[inicio:self._posicao], "big")
+
+    def __call__(self):
+        """
+        Gera um novo ID.
+
+        Returns:
+            str: O ID no formato xxxxxxxx-xxxx-7xxx-xxxx-xxxxxxxxxxxx.
+        """
+        aleatorio = self._aleatorio()
+        ms = time.time_ns() // 1_000_000
+        if ms > self._ultimo_ms:
+            self._ultimo_ms = ms
+            # Semente com bytes próprios (não reaproveita os bits do ID), na
+            # metade inferior para deixar espaço para incrementos
+            self._contador = self._aleatorio(2) >> 5
+        else:
+            self._contador += 1
+            if self._contador > _MAXIMO_CONTADOR:
+                # Esgotou o milissegundo: avança o relógio lógico
+                self._ultimo_ms += 1
+                self._contador = 0
+
+        valor = (self._ultimo_ms << 80) | (0x7 << 76) | (self._contador << 64) \
+            | (0b10 << 62) | (aleatorio & _MASCARA_62_BITS)
+        h = f"{valor:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def gerar_lote(self, quantidade):
+        """
+        Gera vários IDs de uma vez.
+
+        Args:
+            quantidade (int): Quantidade de IDs.
+
+        Returns:
+            list: Os IDs, em ordem crescente.
+        """
+        return [self() for _ in range(quantidade)]
+
+
+def criar_gerador(esquema):
+    """
+    Cria a função geradora de IDs de um esquema.
+
+    Args:
+        esquema (str): "uuid4" (aleatório) ou "uuid7" (ordenado pelo tempo).
+
+    Returns:
+        callable: Função sem argumentos que retorna um novo ID.
+
+    Raises:
+        ValueError: Se o esquema não for suportado.
+    """
+    if esquema == "uuid4":
+        return gerar_uuid4
+    if esquema == "uuid7":
+        return GeradorUUIDv7()
+    raise ValueError(f"Esquema de ID inválido: {esquema}. Use 'uuid4' ou 'uuid7'.")
+
+
+def _prefixo_de_tempo(id_tarefa):
+    """
+    Retorna os 12 dígitos hexadecimais do instante de um UUIDv7, ou None se
+    o ID não for um UUIDv7 (ex.: IDs UUID4 de tarefas antigas).
+    """
+    if not isinstance(id_tarefa, str) or len(id_tarefa) != 36 or id_tarefa[14] != "7":
+        return None
+    return (id_tarefa[:8] + id_tarefa[9:13]).lower()
+
+
+def _prefixo_do_instante(instante):
+    """Converte um datetime para o prefixo de tempo comparável de um UUIDv7."""
+    if instante.tzinfo is None:
+        instante = instante.astimezone() # Interpreta como horário local
+    return f"{int(instante.timestamp() * 1000):012x}"
+
+
+def instante_de_criacao(id_tarefa):
+    """
+    Extrai o instante de criação de um ID UUIDv7.
+
+    Args:
+        id_tarefa (str): O ID da tarefa.
+
+    Returns:
+        datetime or None: O instante (UTC), ou None se o ID não for um UUIDv7.
+    """
+    prefixo = _prefixo_de_tempo(id_tarefa)
+    if prefixo is None:
+        return None
+    try:
+        return datetime.fromtimestamp(int(prefixo, 16) / 1000, tz=timezone.utc)
+    except ValueError:
+        return None
+
+
+def chave_de_criacao(id_tarefa):
+    """
+    Retorna a chave usada no índice de criação: o próprio ID em minúsculas,
+    que ordena pelo instante de criação, ou None se o ID não for um UUIDv7.
+    """
+    if _prefixo_de_tempo(id_tarefa) is None:
+        return None
+    return id_tarefa.lower()
+
+
+def _limite_do_instante(instante):
+    """
+    Converte um datetime no menor ID possível criado nesse instante
+    ("xxxxxxxx-xxxx"), comparável como string com as chaves de criação.
+    """
+    prefixo = _prefixo_do_instante(instante)
+    return f"{prefixo[:8]}-{prefixo[8:]}"
+
+
+def criadas_entre(indice, inicio=None, fim=None):
+    """
+    Seleciona os IDs criados no intervalo [inicio, fim) por busca binária.
+
+    Como o instante é o início de um UUIDv7, a ordem das strings dos IDs é
+    a ordem de criação: os limites do intervalo são localizados com bisect
+    em O(log n), sem examinar cada tarefa.
+
+    Args:
+        indice (list): Pares (chave_de_criacao(id), id) em ordem crescente.
+        inicio (datetime, optional): Início do intervalo (inclusivo).
+        fim (datetime, optional): Fim do intervalo (exclusivo).
+
+    Returns:
+        list: Os IDs do intervalo, em ordem de criação.
+    """
+    baixo = bisect_left(indice, (_limite_do_instante(inicio),)) if inicio is not None else 0
+    alto = bisect_left(indice, (_limite_do_instante(fim),)) if fim is not None else len(indice)
+    return [id_tarefa for _, id_tarefa in indice[baixo:alto]]
@@ -1,14 +1,41 @@
 # gerenciador_tarefas/logica.py
 
-import json
+import heapq
+import os
+from bisect import bisect_left, insort
+from collections import deque
 from .tarefa import Tarefa
+from .alteracoes import FluxoDeAlteracoes
+from .identificadores import chave_de_criacao, criadas_entre, criar_gerador
+from .ordenacao import calcular_chaves, interpretar_criterios, ordenar, validar_limite
+from .recorrencia import SEPARADOR_OCORRENCIA, RegraDeRecorrencia, converter_data
+from .persistencia import (
+    FORMATOS,
+    caminho_do_fragmento,
+    caminho_do_manifesto,
+    carregar_fragmentos,
+    colocar_em_quarentena,
+    decodificar_tarefas,
+    detectar_formato,
+    escrever_json,
+    gravar_num_fragmentos,
+    indice_do_fragmento,
+    ler_json,
+    ler_registros,
+    verificar_num_fragmentos,
+)
+
+# Operações guardadas no histórico de desfazer/refazer por padrão
+LIMITE_HISTORICO_PADRAO = 100
 
 class GerenciadorDeTarefas:
     """
     Gerencia a coleção de tarefas, permitindo adicionar, remover,
     visualizar e modificar tarefas.
     """
-    def __init__(self, arquivo_json="tarefas.json"):
+    def __init__(self, arquivo_json="tarefas.json", num_fragmentos=None,
+                 copias_de_seguranca=3, arquivo_alteracoes=None,
+                 limite_historico=LIMITE_HISTORICO_PADRAO, formato=None, esquema_id="uuid4"):
         """
         Inicializa o gerenciador de tarefas.
         Tenta carregar tarefas de um arquivo JSON, se existir.
@@ -16,10 +43,81 @@ class GerenciadorDeTarefas:
         Args:
             arquivo_json (str, optional): Nome do arquivo JSON para persistência.
                                          Defaults to "tarefas.json".
+            num_fragmentos (int, optional): Se informado, as tarefas são divididas
+                                            entre N arquivos (ex.: tarefas.0.json)
+                                            pelo hash do ID. Defaults to None.
+            copias_de_seguranca (int, optional): Quantas versões anteriores do arquivo
+                                                 manter (tarefas.json.1, .2, ...).
+                                                 Defaults to 3.
+            arquivo_alteracoes (str, optional): Arquivo onde os eventos de alteração
+                                                são registrados para leitores externos.
+                                                Defaults to None (apenas assinantes
+                                                em memória, via self.alteracoes).
+            limite_historico (int, optional): Máximo de operações que podem ser
+                                              desfeitas. O histórico é salvo em
+                                              tarefas.json.historico. Defaults to 100.
+            formato (str, optional): Formato de gravação: "json", "gzip", "zlib" ou
+                                     "lzma". Na leitura o formato é detectado
+                                     automaticamente. Defaults to None (mantém
+                                     o formato do arquivo existente, ou "json"
+                                     se ele ainda não existir).
+            esquema_id (str, optional): Esquema dos IDs de novas tarefas: "uuid4"
+                                        (aleatório) ou "uuid7" (ordenado pela data
+                                        de criação). Tarefas existentes mantêm seus
+                                        IDs. Defaults to "uuid4".
+
+        Raises:
+            ValueError: Se o formato ou o esquema de ID não for suportado, ou se
+                        num_fragmentos não for um inteiro positivo ou não
+                        corresponder ao armazenamento existente (a quantidade
+                        é registrada em tarefas.json.fragmentos).
         """
+        if formato is not None and formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}. Use um de {', '.join(FORMATOS)}.")
+        if num_fragmentos is not None and (not isinstance(num_fragmentos, int)
+                                           or isinstance(num_fragmentos, bool) or num_fragmentos < 1):
+            raise ValueError(f"Quantidade de fragmentos inválida: {num_fragmentos}. "
+                             f"Use um inteiro positivo (ou None para arquivo único).")
+        verificar_num_fragmentos(arquivo_json, num_fragmentos)
         self.tarefas = []
         self.arquivo_json = arquivo_json
+        self.num_fragmentos = num_fragmentos
+        self.copias_de_seguranca = copias_de_seguranca
+        if formato is None:
+            # Abrir um arquivo existente nunca deve trocar seu formato
+            caminhos = ([caminho_do_fragmento(arquivo_json, i) for i in range(num_fragmentos)]
+                        if num_fragmentos else [arquivo_json])
+            formato = next(filter(None, map(detectar_formato, caminhos)), "json")
+        self.formato = formato
+        self._gerar_id = criar_gerador(esquema_id)
+        self.arquivo_quarentena = f"{arquivo_json}.quarentena"
+        self.alteracoes = FluxoDeAlteracoes(arquivo_alteracoes)
+        self.arquivo_historico = f"{arquivo_json}.historico"
+        self.arquivo_recorrencias = f"{arquivo_json}.recorrencias"
+        # Regras de tarefas recorrentes por ID (veja RegraDeRecorrencia)
+        self.recorrencias = {}
+        # Pilhas de operações inversas (ex.: {"op": "remover", "id": ...})
+        self._desfazer = deque(maxlen=limite_historico)
+        self._refazer = deque(maxlen=limite_historico)
+        # Índice das tarefas por ID, para buscas em tempo constante
+        self._por_id = {}
+        # Pares (chave_de_criacao, id) das tarefas com ID UUIDv7, em ordem
+        # crescente, para consultas por data de criação com busca binária
+        self._indice_de_criacao = []
+        # Chaves de ordenação pré-calculadas por ID (veja ordenacao.calcular_chaves)
+        self._chaves_ordenacao = {}
+        # Registros ignorados na última carga, como (posição, mensagem)
+        self.erros_de_carga = []
+        # Ordem de inserção de cada tarefa, usada para mesclar os fragmentos
+        self._ordem = {}
+        self._proxima_ordem = 0
+        # Tarefas de cada fragmento por ID, para regravar um fragmento sem
+        # percorrer todas as tarefas (só no modo fragmentado)
+        self._por_fragmento = [{} for _ in range(num_fragmentos or 0)]
+        self._manifesto_gravado = os.path.exists(caminho_do_manifesto(arquivo_json))
         self._carregar_tarefas()
+        self._carregar_historico()
+        self._carregar_recorrencias()
 
     def adicionar_tarefa(self, descricao, data_vencimento=None):
         """
@@ -36,9 +134,8 @@ class GerenciadorDeTarefas:
             print("Erro: A descrição da tarefa não pode ser vazia.")
             return None
         try:
-            nova_tarefa = Tarefa(descricao.strip(), data_vencimento)
-            self.tarefas.append(nova_tarefa)
-            self._salvar_tarefas()
+            nova_tarefa = Tarefa(descricao.strip(), data_vencimento, id_tarefa=self._gerar_id())
+            self._registrar_no_historico(self._inserir(nova_tarefa))
             print(f"Tarefa '{nova_tarefa.descricao}' adicionada com sucesso.")
             return nova_tarefa
         except ValueError as e:
@@ -46,31 +143,99 @@ class GerenciadorDeTarefas:
             return None
 
 
-    def visualizar_tarefas(self, mostrar_concluidas=True, mostrar_pendentes=True):
+    def visualizar_tarefas(self, mostrar_concluidas=True, mostrar_pendentes=True,
+                           ordenar_por=None, limite=None, inicio=None, fim=None):
         """
         Retorna uma lista de strings representando as tarefas.
 
         Args:
             mostrar_concluidas (bool): Se True, inclui tarefas concluídas.
             mostrar_pendentes (bool): Se True, inclui tarefas pendentes.
+            ordenar_por (str or list, optional): Critérios de ordenação, como em
+                                                 ordenar_tarefas. Defaults to None
+                                                 (ordem de inserção).
+            limite (int, optional): Quantidade máxima de tarefas listadas.
+            inicio (str, optional): Com fim, lista apenas as tarefas que vencem no
+                                    intervalo [inicio, fim] (YYYY-MM-DD), incluindo
+                                    as ocorrências das recorrências, por data de
+                                    vencimento (veja tarefas_entre).
+            fim (str, optional): Última data do intervalo (YYYY-MM-DD).
         
         Returns:
             list: Lista de strings, cada uma representando uma tarefa.
                   Retorna uma lista com uma mensagem se não houver tarefas.
+
+        Raises:
+            ValueError: Se algum critério de ordenação, data ou o limite for inválido,
+                        ou se apenas um dos limites do intervalo for informado.
         """
-        if not self.tarefas:
+        validar_limite(limite)
+        intervalo = inicio is not None or fim is not None
+        candidatas = self.tarefas_entre(inicio, fim) if intervalo else self.tarefas
+        if not self.tarefas and not (intervalo and self.recorrencias):
             return ["Nenhuma tarefa cadastrada."]
 
         tarefas_filtradas = []
-        for tarefa in self.tarefas:
+        for tarefa in candidatas:
             if (mostrar_concluidas and tarefa.concluida) or \
                (mostrar_pendentes and not tarefa.concluida):
-                tarefas_filtradas.append(str(tarefa))
+                tarefas_filtradas.append(tarefa)
         
         if not tarefas_filtradas:
             return ["Nenhuma tarefa corresponde aos critérios de filtro."]
+
+        if ordenar_por and intervalo:
+            # A lista está por vencimento, não na ordem de inserção
+            tarefas_filtradas = ordenar(tarefas_filtradas, interpretar_criterios(ordenar_por),
+                                        self._chaves_de, limite)
+        elif ordenar_por:
+            tarefas_filtradas = self.ordenar_tarefas(ordenar_por, limite, tarefas_filtradas)
+        elif limite is not None:
+            tarefas_filtradas = tarefas_filtradas[:limite]
             
-        return tarefas_filtradas
+        return [str(tarefa) for tarefa in tarefas_filtradas]
+
+    def ordenar_tarefas(self, ordenar_por, limite=None, tarefas=None):
+        """
+        Retorna as tarefas ordenadas por um ou mais campos.
+
+        Args:
+            ordenar_por (str or list): Campos "vencimento", "status", "descricao" ou
+                                       "criacao", separados por vírgula. Um "-" antes
+                                       do campo inverte a ordem. Ex.: "status,-vencimento".
+            limite (int, optional): Retorna apenas as primeiras N tarefas, selecionadas
+                                    por heap sem ordenar a lista inteira.
+            tarefas (list, optional): Tarefas a ordenar. Defaults to todas.
+
+        Returns:
+            list: Objetos Tarefa ordenados.
+
+        Raises:
+            ValueError: Se algum critério ou o limite for inválido.
+        """
+        validar_limite(limite)
+        criterios = interpretar_criterios(ordenar_por)
+        tarefas = self.tarefas if tarefas is None else tarefas
+        if len(criterios) == 1 and criterios[0][0] == "criacao":
+            # A lista já está na ordem de inserção: basta fatiá-la
+            if criterios[0][1]:
+                tarefas = tarefas[::-1]
+            return list(tarefas[:limite])
+        return ordenar(tarefas, criterios, self._chaves_de, limite)
+
+    def _chaves_de(self, tarefa):
+        """
+        Retorna as chaves de ordenação da tarefa, calculando-as só na primeira vez.
+        Método privado.
+        """
+        if tarefa.id not in self._por_id:
+            # Ocorrência de recorrência: gerada a cada consulta, não vai para o cache
+            return calcular_chaves(tarefa, self._proxima_ordem)
+        chaves = self._chaves_ordenacao.get(tarefa.id)
+        if chaves is None:
+            chaves = calcular_chaves(tarefa, self._ordem.get(tarefa.id, 0))
+            self._chaves_ordenacao[tarefa.id] = chaves
+        return chaves
 
     def encontrar_tarefa_por_id(self, id_tarefa):
         """
@@ -84,10 +249,22 @@ class GerenciadorDeTarefas:
         """
         if not id_tarefa or not isinstance(id_tarefa, str):
             return None
-        for tarefa in self.tarefas:
-            if tarefa.id == id_tarefa:
-                return tarefa
-        return None
+        return self._por_id.get(id_tarefa)
+
+    def tarefas_criadas_entre(self, inicio=None, fim=None):
+        """
+        Retorna as tarefas criadas no intervalo [inicio, fim).
+        Só considera tarefas com IDs UUIDv7 (esquema_id="uuid7"), que guardam
+        o instante de criação.
+
+        Args:
+            inicio (datetime, optional): Início do intervalo (inclusivo).
+            fim (datetime, optional): Fim do intervalo (exclusivo).
+
+        Returns:
+            list: Objetos Tarefa, em ordem de criação.
+        """
+        return [self._por_id[id_tarefa] for id_tarefa in criadas_entre(self._indice_de_criacao, inicio, fim)]
 
     def marcar_tarefa_como_concluida(self, id_tarefa):
         """
@@ -102,8 +279,7 @@ class GerenciadorDeTarefas:
         tarefa = self.encontrar_tarefa_por_id(id_tarefa)
         if tarefa:
             if not tarefa.concluida:
-                tarefa.marcar_como_concluida()
-                self._salvar_tarefas()
+                self._registrar_no_historico(self._definir_conclusao(tarefa, True))
                 print(f"Tarefa '{tarefa.descricao}' marcada como concluída.")
                 return True
             else:
@@ -113,6 +289,29 @@ class GerenciadorDeTarefas:
             print(f"Erro: Tarefa com ID '{id_tarefa}' não encontrada.")
             return False
 
+    def marcar_tarefa_como_pendente(self, id_tarefa):
+        """
+        Reabre uma tarefa concluída, marcando-a como pendente.
+
+        Args:
+            id_tarefa (str): O ID da tarefa a ser reaberta.
+
+        Returns:
+            bool: True se a tarefa foi reaberta com sucesso, False caso contrário.
+        """
+        tarefa = self.encontrar_tarefa_por_id(id_tarefa)
+        if tarefa:
+            if tarefa.concluida:
+                self._registrar_no_historico(self._definir_conclusao(tarefa, False))
+                print(f"Tarefa '{tarefa.descricao}' reaberta.")
+                return True
+            else:
+                print(f"Tarefa '{tarefa.descricao}' já estava pendente.")
+                return False
+        else:
+            print(f"Erro: Tarefa com ID '{id_tarefa}' não encontrada.")
+            return False
+
     def remover_tarefa(self, id_tarefa):
         """
         Remove uma tarefa da lista.
@@ -125,22 +324,443 @@ class GerenciadorDeTarefas:
         """
         tarefa = self.encontrar_tarefa_por_id(id_tarefa)
         if tarefa:
-            self.tarefas.remove(tarefa)
-            self._salvar_tarefas()
+            self._registrar_no_historico(self._remover(tarefa))
             print(f"Tarefa '{tarefa.descricao}' removida com sucesso.")
             return True
         else:
             print(f"Erro: Tarefa com ID '{id_tarefa}' não encontrada para remoção.")
             return False
 
-    def _salvar_tarefas(self):
+    def adicionar_recorrencia(self, descricao, data_inicio, frequencia, intervalo=1, data_fim=None):
+        """
+        Adiciona uma regra de tarefa recorrente.
+
+        As tarefas de cada ocorrência não são gravadas no arquivo de tarefas:
+        são geradas sob demanda por tarefas_recorrentes_entre.
+
+        Args:
+            descricao (str): A descrição das tarefas geradas.
+            data_inicio (str): Data da primeira ocorrência (YYYY-MM-DD).
+            frequencia (str): "diaria", "semanal" ou "mensal".
+            intervalo (int, optional): Repete a cada N dias/semanas/meses. Defaults to 1.
+            data_fim (str, optional): Última data possível (YYYY-MM-DD). Defaults to None.
+
+        Returns:
+            RegraDeRecorrencia: A regra criada, ou None se algum parâmetro for inválido.
+        """
+        if not descricao or not isinstance(descricao, str) or not descricao.strip():
+            print("Erro: A descrição da tarefa não pode ser vazia.")
+            return None
+        try:
+            regra = RegraDeRecorrencia(descricao.strip(), data_inicio, frequencia, intervalo, data_fim)
+        except ValueError as e:
+            print(f"Erro ao criar recorrência: {e}")
+            return None
+        self.recorrencias[regra.id] = regra
+        self._salvar_recorrencias()
+        print(f"Recorrência '{regra.descricao}' adicionada com sucesso.")
+        return regra
+
+    def remover_recorrencia(self, id_regra):
+        """
+        Remove uma regra de tarefa recorrente e todas as suas ocorrências.
+
+        Args:
+            id_regra (str): O ID da regra.
+
+        Returns:
+            bool: True se a regra foi removida com sucesso, False caso contrário.
+        """
+        regra = self.recorrencias.pop(id_regra, None) if isinstance(id_regra, str) else None
+        if regra:
+            self._salvar_recorrencias()
+            print(f"Recorrência '{regra.descricao}' removida com sucesso.")
+            return True
+        print(f"Erro: Recorrência com ID '{id_regra}' não encontrada para remoção.")
+        return False
+
+    def tarefas_recorrentes_entre(self, inicio, fim):
+        """
+        Gera as tarefas de todas as recorrências no intervalo [inicio, fim].
+        Apenas as ocorrências do intervalo são criadas, por mais longa que
+        seja a série.
+
+        Args:
+            inicio (str): Primeira data do intervalo (YYYY-MM-DD).
+            fim (str): Última data do intervalo (YYYY-MM-DD).
+
+        Returns:
+            list: Objetos Tarefa ordenados por data de vencimento.
+
+        Raises:
+            ValueError: Se alguma data for inválida.
+        """
+        series = [regra.tarefas_entre(inicio, fim) for regra in self.recorrencias.values()]
+        return list(heapq.merge(*series, key=lambda tarefa: tarefa.data_vencimento))
+
+    def tarefas_entre(self, inicio, fim):
+        """
+        Retorna as tarefas que vencem no intervalo [inicio, fim]: as tarefas
+        comuns com data de vencimento no intervalo e as ocorrências das
+        recorrências (veja tarefas_recorrentes_entre).
+
+        Args:
+            inicio (str): Primeira data do intervalo (YYYY-MM-DD).
+            fim (str): Última data do intervalo (YYYY-MM-DD).
+
+        Returns:
+            list: Objetos Tarefa ordenados por data de vencimento. No mesmo dia,
+                  as tarefas comuns vêm antes, na ordem de inserção.
+
+        Raises:
+            ValueError: Se alguma data for inválida ou faltar um dos limites.
+        """
+        if inicio is None or fim is None:
+            raise ValueError("Informe o início e o fim do intervalo de datas.")
+        inicio = converter_data(inicio).isoformat()
+        fim = converter_data(fim).isoformat()
+        comuns = sorted((t for t in self.tarefas
+                         if t.data_vencimento and inicio <= t.data_vencimento <= fim),
+                        key=lambda tarefa: tarefa.data_vencimento)
+        return list(heapq.merge(comuns, self.tarefas_recorrentes_entre(inicio, fim),
+                                key=lambda tarefa: tarefa.data_vencimento))
+
+    def marcar_ocorrencia_como_concluida(self, id_ocorrencia, concluida=True):
+        """
+        Marca uma ocorrência de uma recorrência como concluída (ou pendente).
+        Só a data da ocorrência é registrada na regra; a série não é gerada.
+        Como as demais alterações, publica um evento e pode ser desfeita.
+
+        Args:
+            id_ocorrencia (str): O ID da ocorrência ("<id da regra>@YYYY-MM-DD").
+            concluida (bool, optional): False para reabrir a ocorrência. Defaults to True.
+
+        Returns:
+            bool: True se o status foi alterado, False caso contrário.
+        """
+        regra, data = self._localizar_ocorrencia(id_ocorrencia)
+        if regra is None:
+            print(f"Erro: Ocorrência com ID '{id_ocorrencia}' não encontrada.")
+            return False
+        if (data in regra.concluidas) == concluida:
+            print(f"Ocorrência '{regra.descricao}' de {data} já estava "
+                  f"{'concluída' if concluida else 'pendente'}.")
+            return False
+
+        self._registrar_no_historico(self._definir_conclusao_da_ocorrencia(regra, data, concluida))
+        print(f"Ocorrência '{regra.descricao}' de {data} marcada como "
+              f"{'concluída' if concluida else 'pendente'}.")
+        return True
+
+    def _localizar_ocorrencia(self, id_ocorrencia):
+        """
+        Encontra a regra e a data de uma ocorrência pelo seu ID.
+        Método privado.
+
+        Returns:
+            tuple: (RegraDeRecorrencia, data YYYY-MM-DD), ou (None, None) se o ID
+                   não corresponder a uma ocorrência.
+        """
+        id_regra, _, data = str(id_ocorrencia).rpartition(SEPARADOR_OCORRENCIA)
+        regra = self.recorrencias.get(id_regra)
+        try:
+            data = converter_data(data).isoformat()
+            if regra is not None and regra.e_ocorrencia(data):
+                return regra, data
+        except ValueError:
+            pass
+        return None, None
+
+    def _definir_conclusao_da_ocorrencia(self, regra, data, concluida):
+        """
+        Marca a ocorrência como concluída ou pendente, salva e publica o evento.
+        Método privado.
+
+        Returns:
+            dict: A operação inversa.
+        """
+        if concluida:
+            regra.concluidas.add(data)
+        else:
+            regra.concluidas.discard(data)
+        self._salvar_recorrencias()
+        tarefa = next(regra.tarefas_entre(data, data))
+        self.alteracoes.publicar("concluida" if concluida else "reaberta", tarefa)
+        return {"op": "reabrir_ocorrencia" if concluida else "concluir_ocorrencia", "id": tarefa.id}
+
+    def _salvar_recorrencias(self):
+        """
+        Salva as regras de recorrência ao lado do arquivo de tarefas.
+        Método privado.
+        """
+        try:
+            escrever_json(self.arquivo_recorrencias,
+                          [regra.to_dict() for regra in self.recorrencias.values()],
+                          self.copias_de_seguranca)
+        except IOError as e:
+            print(f"Erro ao salvar recorrências no arquivo {self.arquivo_recorrencias}: {e}")
+
+    def _carregar_recorrencias(self):
+        """
+        Carrega as regras de recorrência salvas, se existirem.
+        Método privado.
+        """
+        try:
+            dados = ler_json(self.arquivo_recorrencias)
+        except FileNotFoundError:
+            return
+        except (IOError, ValueError) as e:
+            print(f"Erro ao carregar recorrências do arquivo {self.arquivo_recorrencias}: {e}")
+            return
+        for data in dados if isinstance(dados, list) else []:
+            try:
+                regra = RegraDeRecorrencia.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Recorrência inválida em {self.arquivo_recorrencias} ignorada: {e}")
+                continue
+            self.recorrencias[regra.id] = regra
+
+    def desfazer(self):
+        """
+        Desfaz a última operação (adicionar, concluir, reabrir ou remover).
+        Custa o mesmo que a operação original: desfazer uma adição ou remoção
+        percorre a lista de tarefas (O(n)) e cada operação regrava o arquivo
+        inteiro, ou só o fragmento da tarefa no armazenamento fragmentado.
+
+        Returns:
+            bool: True se uma operação foi desfeita, False se não havia o que desfazer.
+        """
+        return self._mover_no_historico(self._desfazer, self._refazer, "desfeita")
+
+    def refazer(self):
+        """
+        Refaz a última operação desfeita.
+
+        Returns:
+            bool: True se uma operação foi refeita, False se não havia o que refazer.
+        """
+        return self._mover_no_historico(self._refazer, self._desfazer, "refeita")
+
+    def _mover_no_historico(self, origem, destino, verbo):
+        """
+        Aplica a operação do topo de uma pilha e empilha sua inversa na outra.
+        Se a operação não corresponder às tarefas atuais (ex.: o arquivo foi
+        alterado fora do gerenciador), nada é aplicado e as pilhas são mantidas.
+        Método privado.
+        """
+        if not origem:
+            print(f"Nenhuma operação para ser {verbo}.")
+            return False
+        operacao = origem[-1]
+        try:
+            inversa = self._aplicar_operacao(operacao)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Operação inválida no histórico: {e}. O histórico foi mantido.")
+            return False
+        if inversa is None:
+            print(f"A última operação não corresponde às tarefas atuais ({operacao.get('op')} "
+                  f"{self._id_da_operacao(operacao)}) e não pode ser {verbo}. O histórico foi mantido.")
+            return False
+        origem.pop()
+        destino.append(inversa)
+        self._salvar_historico()
+        print(f"Última operação {verbo}.")
+        return True
+
+    @staticmethod
+    def _id_da_operacao(operacao):
+        """
+        Retorna o ID da tarefa de uma operação do histórico.
+        Método privado.
+        """
+        if operacao.get("op") == "inserir":
+            return operacao["tarefa"].get("id")
+        return operacao.get("id")
+
+    def _aplicar_operacao(self, operacao):
+        """
+        Aplica uma operação do histórico.
+        Método privado.
+
+        Returns:
+            dict or None: A operação inversa, ou None se a operação não se aplica.
+
+        Raises:
+            ValueError: Se o tipo da operação não for conhecido.
+        """
+        if operacao["op"] == "inserir":
+            if operacao["tarefa"]["id"] in self._por_id:
+                return None
+            tarefa = Tarefa.from_dict(operacao["tarefa"])
+            return self._inserir(tarefa, operacao["posicao"], operacao["ordem"])
+        if operacao["op"] in ("concluir_ocorrencia", "reabrir_ocorrencia"):
+            regra, data = self._localizar_ocorrencia(operacao["id"])
+            concluida = operacao["op"] == "concluir_ocorrencia"
+            if regra is None or (data in regra.concluidas) == concluida:
+                return None
+            return self._definir_conclusao_da_ocorrencia(regra, data, concluida)
+        if operacao["op"] not in ("remover", "concluir", "reabrir"):
+            raise ValueError(f"tipo de operação '{operacao['op']}' desconhecido")
+
+        tarefa = self._por_id.get(operacao["id"])
+        if tarefa is None:
+            return None
+        if operacao["op"] == "remover":
+            return self._remover(tarefa)
+        return self._definir_conclusao(tarefa, operacao["op"] == "concluir")
+
+    def _registrar_no_historico(self, inversa):
+        """
+        Registra a inversa de uma operação feita pelo usuário.
+        Uma nova operação invalida o que havia para refazer.
+        Método privado.
+        """
+        self._desfazer.append(inversa)
+        self._refazer.clear()
+        self._salvar_historico()
+
+    def _inserir(self, tarefa, posicao=None, ordem=None):
+        """
+        Insere a tarefa na posição indicada (ou no fim), salva e publica o evento.
+        Inserir fora do fim desloca as tarefas seguintes da lista (O(n)).
+        Método privado.
+
+        Returns:
+            dict: A operação inversa.
+        """
+        if posicao is None or posicao > len(self.tarefas):
+            posicao = len(self.tarefas)
+        self.tarefas.insert(posicao, tarefa)
+        self._por_id[tarefa.id] = tarefa
+        if self.num_fragmentos:
+            self._por_fragmento[indice_do_fragmento(tarefa.id, self.num_fragmentos)][tarefa.id] = tarefa
+        chave = chave_de_criacao(tarefa.id)
+        if chave is not None:
+            insort(self._indice_de_criacao, (chave, tarefa.id)) # IDs novos costumam ir para o fim
+        self._chaves_ordenacao.pop(tarefa.id, None)
+        self._registrar_ordem(tarefa, ordem)
+        self._salvar_tarefas([tarefa])
+        self.alteracoes.publicar("adicionada", tarefa)
+        return {"op": "remover", "id": tarefa.id}
+
+    def _remover(self, tarefa):
+        """
+        Remove a tarefa, salva e publica o evento.
+        Localizar e retirar a tarefa da lista é O(n).
+        Método privado.
+
+        Returns:
+            dict: A operação inversa, com os dados necessários para reinserir a tarefa.
+        """
+        posicao = self.tarefas.index(tarefa)
+        inversa = {"op": "inserir", "tarefa": tarefa.to_dict(),
+                   "posicao": posicao, "ordem": self._ordem.get(tarefa.id)}
+        del self.tarefas[posicao]
+        del self._por_id[tarefa.id]
+        if self.num_fragmentos:
+            del self._por_fragmento[indice_do_fragmento(tarefa.id, self.num_fragmentos)][tarefa.id]
+        chave = chave_de_criacao(tarefa.id)
+        if chave is not None:
+            del self._indice_de_criacao[bisect_left(self._indice_de_criacao, (chave, tarefa.id))]
+        self._ordem.pop(tarefa.id, None)
+        self._chaves_ordenacao.pop(tarefa.id, None)
+        self._salvar_tarefas([tarefa])
+        self.alteracoes.publicar("removida", tarefa)
+        return inversa
+
+    def _definir_conclusao(self, tarefa, concluida):
+        """
+        Marca a tarefa como concluída ou pendente, salva e publica o evento.
+        Método privado.
+
+        Returns:
+            dict: A operação inversa.
+        """
+        if concluida:
+            tarefa.marcar_como_concluida()
+        else:
+            tarefa.marcar_como_pendente()
+        self._chaves_ordenacao.pop(tarefa.id, None)
+        self._salvar_tarefas([tarefa])
+        self.alteracoes.publicar("concluida" if concluida else "reaberta", tarefa)
+        return {"op": "reabrir" if concluida else "concluir", "id": tarefa.id}
+
+    def _salvar_historico(self):
+        """
+        Salva as pilhas de desfazer/refazer ao lado do arquivo de tarefas.
+        Método privado.
+        """
+        try:
+            escrever_json(self.arquivo_historico,
+                          {"desfazer": list(self._desfazer), "refazer": list(self._refazer)})
+        except IOError as e:
+            print(f"Erro ao salvar histórico no arquivo {self.arquivo_historico}: {e}")
+
+    def _carregar_historico(self):
+        """
+        Carrega as pilhas de desfazer/refazer salvas, se existirem.
+        Um histórico ilegível é descartado sem afetar as tarefas.
+        Método privado.
+        """
+        try:
+            historico = ler_json(self.arquivo_historico)
+            self._desfazer.extend(historico.get("desfazer", []))
+            self._refazer.extend(historico.get("refazer", []))
+        except FileNotFoundError:
+            pass
+        except (IOError, ValueError, AttributeError) as e:
+            print(f"Histórico em {self.arquivo_historico} ignorado: {e}")
+
+    def _registrar_ordem(self, tarefa, ordem=None):
+        """
+        Atribui à tarefa sua posição na ordem de inserção. Um valor ausente ou
+        que não seja inteiro (ex.: "ordem" adulterado no arquivo) coloca a
+        tarefa no fim, em vez de impedir a carga.
+        Método privado.
+        """
+        if not isinstance(ordem, int) or isinstance(ordem, bool):
+            ordem = self._proxima_ordem
+        self._ordem[tarefa.id] = ordem
+        self._proxima_ordem = max(self._proxima_ordem, ordem + 1)
+
+    def _indexar_fragmentos(self):
+        """
+        Reconstrói o índice das tarefas de cada fragmento.
+        Método privado.
+        """
+        self._por_fragmento = [{} for _ in range(self.num_fragmentos or 0)]
+        if self.num_fragmentos:
+            for tarefa in self.tarefas:
+                self._por_fragmento[indice_do_fragmento(tarefa.id, self.num_fragmentos)][tarefa.id] = tarefa
+
+    def _salvar_tarefas(self, alteradas=None):
         """
         Salva a lista de tarefas em um arquivo JSON.
+        No modo fragmentado, regrava apenas os fragmentos das tarefas alteradas.
         Método privado.
+
+        Args:
+            alteradas (list, optional): Tarefas modificadas desde o último salvamento.
+                                        Se None, todos os fragmentos são regravados.
         """
         try:
-            with open(self.arquivo_json, "w", encoding="utf-8") as f:
-                json.dump([tarefa.to_dict() for tarefa in self.tarefas], f, indent=4, ensure_ascii=False)
+            if self.num_fragmentos:
+                if not self._manifesto_gravado:
+                    gravar_num_fragmentos(self.arquivo_json, self.num_fragmentos)
+                    self._manifesto_gravado = True
+                if alteradas is None:
+                    indices = range(self.num_fragmentos)
+                else:
+                    indices = {indice_do_fragmento(t.id, self.num_fragmentos) for t in alteradas}
+                for indice in indices:
+                    # Serializa só as tarefas do fragmento, na ordem de inserção
+                    tarefas = sorted(self._por_fragmento[indice].values(), key=lambda t: self._ordem[t.id])
+                    escrever_json(caminho_do_fragmento(self.arquivo_json, indice),
+                                  [dict(t.to_dict(), ordem=self._ordem[t.id]) for t in tarefas],
+                                  self.copias_de_seguranca, self.formato)
+            else:
+                escrever_json(self.arquivo_json, [tarefa.to_dict() for tarefa in self.tarefas],
+                              self.copias_de_seguranca, self.formato)
         except IOError as e:
             print(f"Erro ao salvar tarefas no arquivo {self.arquivo_json}: {e}")
 
@@ -148,29 +768,68 @@ class GerenciadorDeTarefas:
     def _carregar_tarefas(self):
         """
         Carrega a lista de tarefas de um arquivo JSON.
+        No modo fragmentado, lê os fragmentos em paralelo e os mescla em ordem.
+
+        Se o arquivo estiver corrompido, todos os registros legíveis e válidos são
+        mantidos; o restante vai para o arquivo de quarentena e o arquivo é
+        regravado (a versão original fica na primeira cópia de segurança).
         Método privado.
         """
         try:
-            with open(self.arquivo_json, "r", encoding="utf-8") as f:
-                tarefas_data = json.load(f)
-                self.tarefas = [Tarefa.from_dict(data) for data in tarefas_data]
+            if self.num_fragmentos:
+                tarefas_data, corrompidos = carregar_fragmentos(self.arquivo_json, self.num_fragmentos)
+            else:
+                tarefas_data, corrompidos = ler_registros(self.arquivo_json)
+            if corrompidos:
+                print(f"Erro ao decodificar JSON do arquivo {self.arquivo_json}: {corrompidos[0]['erro']}. "
+                      f"{len(tarefas_data)} registro(s) recuperado(s).")
+
+            validos, self.erros_de_carga = decodificar_tarefas(tarefas_data)
+            self.tarefas = [tarefa for _, tarefa in validos]
+            self._por_id = {tarefa.id: tarefa for tarefa in self.tarefas}
+            self._indexar_fragmentos()
+            pares = ((chave_de_criacao(t.id), t.id) for t in self.tarefas)
+            self._indice_de_criacao = sorted(par for par in pares if par[0] is not None)
+            self._chaves_ordenacao = {}
+            self._ordem = {}
+            self._proxima_ordem = 0
+            for posicao, tarefa in validos:
+                self._registrar_ordem(tarefa, tarefas_data[posicao].get("ordem", posicao))
+            for posicao, erro in self.erros_de_carga:
+                print(f"Registro {posicao} do arquivo {self.arquivo_json} ignorado: {erro}")
             print(f"Tarefas carregadas de {self.arquivo_json}")
+
+            invalidos = [{"posicao": posicao, "erro": erro, "registro": tarefas_data[posicao]}
+                         for posicao, erro in self.erros_de_carga]
+            if corrompidos or invalidos:
+                colocar_em_quarentena(self.arquivo_quarentena, corrompidos + invalidos)
+                print(f"{len(corrompidos) + len(invalidos)} item(ns) movido(s) para {self.arquivo_quarentena}.")
+                self._salvar_tarefas()
         except FileNotFoundError:
             print(f"Arquivo {self.arquivo_json} não encontrado. Iniciando com lista de tarefas vazia.")
             self.tarefas = []
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            print(f"Erro ao decodificar JSON do arquivo {self.arquivo_json}: {e}. Iniciando com lista vazia.")
-            self.tarefas = []
-        except (IOError, ValueError) as e: # ValueError pode vir de Tarefa.from_dict
+        except IOError as e:
             print(f"Erro ao carregar tarefas do arquivo {self.arquivo_json}: {e}. Iniciando com lista vazia.")
             self.tarefas = []
-            
+
     def limpar_todas_as_tarefas(self):
         """
         Remove todas as tarefas da lista e do arquivo de persistência.
         Útil para testes ou para resetar o estado.
         """
+        removidas = self.tarefas
         self.tarefas = []
+        self._por_id = {}
+        self._indexar_fragmentos()
+        self._indice_de_criacao = []
+        self._ordem = {}
+        self._chaves_ordenacao = {}
+        # Limpar é um reset: não pode ser desfeito e descarta o histórico
+        self._desfazer.clear()
+        self._refazer.clear()
+        self._salvar_historico()
         self._salvar_tarefas() # Salva a lista vazia para limpar o arquivo
+        for tarefa in removidas:
+            self.alteracoes.publicar("removida", tarefa)
         print("Todas as tarefas foram removidas.")
 
@@ -0,0 +1,149 @@
+# gerenciador_tarefas/ordenacao.py
+
+import heapq
+from datetime import date
+from operator import itemgetter
+
+# Campos pelos quais as tarefas podem ser ordenadas
+CAMPOS = ("vencimento", "status", "descricao", "criacao")
+
+# Chave de vencimento das tarefas sem data: maior que qualquer date.toordinal()
+_SEM_DATA = date.max.toordinal() + 1
+
+
+class _Invertida:
+    """
+    Envolve um valor invertendo sua comparação, para ordenar um campo em
+    ordem decrescente junto com outros em ordem crescente (strings não
+    podem simplesmente ser negadas como números).
+    """
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __lt__(self, outro):
+        return outro.valor < self.valor
+
+    def __eq__(self, outro):
+        return self.valor == outro.valor
+
+
+def interpretar_criterios(ordenar_por):
+    """
+    Interpreta os critérios de ordenação.
+
+    Args:
+        ordenar_por (str or list): Campos separados por vírgula ou lista de campos.
+                                   Um "-" antes do campo indica ordem decrescente.
+                                   Ex.: "vencimento,-status".
+
+    Returns:
+        list: Pares (campo, decrescente).
+
+    Raises:
+        ValueError: Se algum campo não for suportado.
+    """
+    if isinstance(ordenar_por, str):
+        ordenar_por = ordenar_por.split(",")
+    criterios = []
+    for item in ordenar_por:
+        item = item.strip()
+        decrescente = item.startswith("-")
+        campo = item.lstrip("+-")
+        if campo not in CAMPOS:
+            raise ValueError(f"Campo de ordenação inválido: {campo}. Use um de {', '.join(CAMPOS)}.")
+        criterios.append((campo, decrescente))
+    return criterios
+
+
+def validar_limite(limite):
+    """
+    Verifica a quantidade máxima de tarefas de uma listagem.
+
+    Raises:
+        ValueError: Se o limite não for None nem um inteiro não negativo.
+    """
+    if limite is None:
+        return
+    if not isinstance(limite, int) or isinstance(limite, bool) or limite < 0:
+        raise ValueError(f"Limite inválido: {limite!r}. Use um número inteiro não negativo.")
+
+
+def _chave_de_vencimento(data_vencimento):
+    """
+    Converte a data de vencimento no número do dia (date.toordinal). Tarefas
+    sem data (ou com data inválida) recebem _SEM_DATA e vêm depois, em
+    qualquer direção de ordenação.
+    """
+    if data_vencimento:
+        try:
+            return date.fromisoformat(data_vencimento).toordinal()
+        except (TypeError, ValueError):
+            pass
+    return _SEM_DATA
+
+
+def calcular_chaves(tarefa, ordem):
+    """
+    Pré-calcula as chaves de ordenação de uma tarefa, para que a data de
+    vencimento seja interpretada uma única vez e não a cada comparação.
+
+    Args:
+        tarefa (Tarefa): A tarefa.
+        ordem (int): Posição da tarefa na ordem de inserção.
+
+    Returns:
+        dict: Chave de cada campo de CAMPOS.
+    """
+    return {
+        "vencimento": _chave_de_vencimento(tarefa.data_vencimento),
+        "status": tarefa.concluida,
+        "descricao": tarefa.descricao.casefold(),
+        "criacao": ordem,
+    }
+
+
+def _inverter(campo, chave):
+    """
+    Inverte a chave de um campo para ordem decrescente. Tarefas sem data de
+    vencimento continuam no fim; só strings precisam de _Invertida.
+    """
+    if campo == "vencimento":
+        return chave if chave == _SEM_DATA else -chave
+    if campo == "descricao":
+        return _Invertida(chave)
+    return -chave
+
+
+def ordenar(tarefas, criterios, chaves_de, limite=None):
+    """
+    Ordena as tarefas pelos critérios.
+
+    Com limite, usa seleção por heap (heapq.nsmallest), que custa
+    O(n log k) em vez de ordenar a lista inteira. Empates mantêm a ordem
+    de entrada.
+
+    Args:
+        tarefas (list): Tarefas a ordenar.
+        criterios (list): Pares (campo, decrescente), como em interpretar_criterios.
+        chaves_de (callable): Retorna o dicionário de chaves de uma tarefa.
+        limite (int, optional): Quantidade máxima de tarefas no resultado.
+
+    Returns:
+        list: As tarefas ordenadas.
+    """
+    campos = [campo for campo, _ in criterios]
+    pegar = itemgetter(*campos)
+    if not any(decrescente for _, decrescente in criterios):
+        def chave(tarefa):
+            return pegar(chaves_de(tarefa))
+    else:
+        def chave(tarefa):
+            chaves = chaves_de(tarefa)
+            return tuple([_inverter(campo, chaves[campo]) if decrescente else chaves[campo]
+                          for campo, decrescente in criterios])
+
+    if limite is not None and limite < len(tarefas):
+        return heapq.nsmallest(limite, tarefas, key=chave)
+    return sorted(tarefas, key=chave)
@@ -0,0 +1,564 @@
+# gerenciador_tarefas/persistencia.py
+
+import gzip
+import heapq
+import io
+import json
+import lzma
+import os
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from .tarefa import Tarefa
+
+# Vírgulas e espaços entre registros de uma lista JSON
+_SEPARADORES = re.compile(r"[\s,]*")
+
+# Formatos aceitos para gravação. Na leitura o formato é detectado pelos
+# primeiros bytes do arquivo, então arquivos de formatos diferentes convivem.
+FORMATOS = ("json", "gzip", "zlib", "lzma")
+
+# Nível de compressão de gzip/zlib: bem mais rápido que o padrão (9) e com
+# tamanho quase igual para JSON repetitivo
+_NIVEL_COMPRESSAO = 6
+
+# Bytes de entrada descomprimidos por vez; permite aproveitar o início de
+# um arquivo comprimido truncado
+_TAMANHO_BLOCO = 1024 * 1024
+
+
+class _EscritorZlib(io.RawIOBase):
+    """
+    Arquivo binário que comprime com zlib tudo o que recebe.
+    O módulo zlib não oferece um equivalente a gzip.open/lzma.open.
+    """
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self._compressor = zlib.compressobj(_NIVEL_COMPRESSAO)
+
+    def writable(self):
+        return True
+
+    def write(self, dados):
+        self._arquivo.write(self._compressor.compress(dados))
+        return len(dados)
+
+    def close(self):
+        if not self.closed:
+            self._arquivo.write(self._compressor.flush())
+            self._arquivo.close()
+        super().close()
+
+
+def _abrir_para_escrita(caminho, formato):
+    """
+    Abre um arquivo de texto que comprime os dados conforme o formato.
+    """
+    if formato == "json":
+        return open(caminho, "w", encoding="utf-8")
+    if formato == "gzip":
+        return gzip.open(caminho, "wt", encoding="utf-8", compresslevel=_NIVEL_COMPRESSAO)
+    if formato == "lzma":
+        return lzma.open(caminho, "wt", encoding="utf-8")
+    if formato == "zlib":
+        binario = io.BufferedWriter(_EscritorZlib(open(caminho, "wb")))
+        return io.TextIOWrapper(binario, encoding="utf-8")
+    raise ValueError(f"Formato inválido: {formato}. Use um de {', '.join(FORMATOS)}.")
+
+
+def _formato_do_conteudo(bruto):
+    """Identifica o formato (um dos valores de FORMATOS) pelos primeiros bytes."""
+    if bruto[:2] == b"\x1f\x8b":
+        return "gzip"
+    if bruto[:6] == b"\xfd7zXZ\x00":
+        return "lzma"
+    if len(bruto) >= 2 and bruto[0] == 0x78 and (bruto[0] * 256 + bruto[1]) % 31 == 0:
+        return "zlib" # "x" não inicia um JSON válido
+    return "json"
+
+
+def detectar_formato(caminho):
+    """
+    Detecta o formato de um arquivo de tarefas pelos seus primeiros bytes.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+
+    Returns:
+        str or None: Um dos valores de FORMATOS, ou None se o arquivo não
+                     existir ou estiver vazio.
+    """
+    try:
+        with open(caminho, "rb") as f:
+            bruto = f.read(6)
+    except FileNotFoundError:
+        return None
+    return _formato_do_conteudo(bruto) if bruto else None
+
+
+def _descompressor(bruto):
+    """
+    Escolhe o descompressor pelos primeiros bytes do arquivo.
+
+    Returns:
+        objeto ou None: Descompressor incremental, ou None se o conteúdo é JSON puro.
+    """
+    formato = _formato_do_conteudo(bruto)
+    if formato == "gzip":
+        return zlib.decompressobj(wbits=31)
+    if formato == "lzma":
+        return lzma.LZMADecompressor()
+    if formato == "zlib":
+        return zlib.decompressobj()
+    return None
+
+
+def _descomprimir(bruto):
+    """
+    Descomprime o conteúdo de um arquivo, se estiver comprimido.
+
+    Returns:
+        tuple: (bytes descomprimidos, mensagem de erro ou None). Em caso de dano,
+               retorna tudo o que foi possível descomprimir antes dele.
+    """
+    descompressor = _descompressor(bruto)
+    if descompressor is None:
+        return bruto, None
+
+    partes = []
+    try:
+        for inicio in range(0, len(bruto), _TAMANHO_BLOCO):
+            partes.append(descompressor.decompress(bruto[inicio:inicio + _TAMANHO_BLOCO]))
+            if descompressor.eof:
+                break
+    except (zlib.error, lzma.LZMAError) as e:
+        return b"".join(partes), f"Conteúdo comprimido danificado: {e}"
+    if not descompressor.eof:
+        return b"".join(partes), "Conteúdo comprimido truncado."
+    return b"".join(partes), None
+
+
+def _rotacionar_copias(caminho, copias):
+    """
+    Desloca as cópias de segurança (caminho.1 -> caminho.2, ...) e move o
+    arquivo atual para caminho.1. A cópia mais antiga além do limite é descartada.
+    """
+    for i in range(copias - 1, 0, -1):
+        if os.path.exists(f"{caminho}.{i}"):
+            os.replace(f"{caminho}.{i}", f"{caminho}.{i + 1}")
+    os.replace(caminho, f"{caminho}.1")
+
+
+def escrever_json(caminho, dados, copias=0, formato="json"):
+    """
+    Escreve os dados em um arquivo JSON, opcionalmente comprimido.
+
+    A escrita é feita em um arquivo temporário que só então substitui o
+    original, para que uma falha no meio da gravação nunca trunque os dados.
+    Nos formatos comprimidos o JSON é gravado sem indentação e comprimido
+    à medida que é gerado, sem montar o texto inteiro em memória.
+
+    Args:
+        caminho (str): Caminho do arquivo de destino.
+        dados (list): Dados serializáveis em JSON.
+        copias (int, optional): Quantas versões anteriores manter como
+                                caminho.1 ... caminho.N. Defaults to 0.
+        formato (str, optional): Um dos valores de FORMATOS. Defaults to "json".
+    """
+    temporario = f"{caminho}.tmp"
+    with _abrir_para_escrita(temporario, formato) as f:
+        if formato == "json":
+            json.dump(dados, f, indent=4, ensure_ascii=False)
+        else:
+            json.dump(dados, f, separators=(",", ":"), ensure_ascii=False)
+    if copias and os.path.exists(caminho):
+        _rotacionar_copias(caminho, copias)
+    os.replace(temporario, caminho)
+
+
+def ler_json(caminho):
+    """
+    Lê os dados de um arquivo JSON, comprimido ou não.
+
+    Args:
+        caminho (str): Caminho do arquivo de origem.
+
+    Returns:
+        list: Os dados decodificados.
+
+    Raises:
+        ValueError: Se o conteúdo comprimido estiver danificado ou o JSON for inválido.
+    """
+    with open(caminho, "rb") as f:
+        bruto, erro = _descomprimir(f.read())
+    if erro:
+        raise ValueError(erro)
+    return json.loads(bruto.decode("utf-8"))
+
+
+def recuperar_registros(texto):
+    """
+    Extrai todos os registros legíveis de uma lista JSON corrompida ou truncada.
+
+    Os registros são decodificados um a um; ao encontrar um trecho ilegível,
+    a leitura salta para o próximo "{" e continua dali.
+
+    Args:
+        texto (str): Conteúdo do arquivo.
+
+    Returns:
+        tuple: (registros recuperados, lista de trechos corrompidos). Cada trecho
+               é um dicionário com "posicao", "erro" e "trecho".
+    """
+    decodificador = json.JSONDecoder()
+    registros = []
+    corrompidos = []
+    inicio_lista = texto.find("[")
+    posicao = inicio_lista + 1 if inicio_lista >= 0 else 0
+    while True:
+        posicao = _SEPARADORES.match(texto, posicao).end()
+        if posicao >= len(texto) or texto[posicao] == "]":
+            break
+        try:
+            registro, posicao = decodificador.raw_decode(texto, posicao)
+            registros.append(registro)
+        except json.JSONDecodeError as e:
+            proximo = texto.find("{", posicao + 1)
+            if proximo < 0:
+                proximo = len(texto)
+            corrompidos.append({"posicao": posicao, "erro": str(e), "trecho": texto[posicao:proximo]})
+            posicao = proximo
+    return registros, corrompidos
+
+
+def ler_registros(caminho):
+    """
+    Lê a lista de registros de um arquivo, recuperando o que for possível
+    caso o conteúdo esteja corrompido.
+
+    Args:
+        caminho (str): Caminho do arquivo de origem.
+
+    Returns:
+        tuple: (registros, trechos corrompidos). Veja recuperar_registros.
+    """
+    with open(caminho, "rb") as f:
+        bruto, erro = _descomprimir(f.read())
+    corrompidos = []
+    if erro:
+        corrompidos.append({"posicao": len(bruto), "erro": erro, "trecho": ""})
+    try:
+        texto = bruto.decode("utf-8")
+    except UnicodeDecodeError as e:
+        texto = bruto.decode("utf-8", errors="replace")
+        trecho = bruto[e.start:e.end].decode("latin-1")
+        corrompidos.append({"posicao": e.start, "erro": str(e), "trecho": trecho})
+
+    try:
+        registros = json.loads(texto)
+    except json.JSONDecodeError:
+        registros, recuperados = recuperar_registros(texto)
+        return registros, corrompidos + recuperados
+
+    if not isinstance(registros, list):
+        erro = "O arquivo deve conter uma lista de tarefas."
+        return [], corrompidos + [{"posicao": 0, "erro": erro, "trecho": texto}]
+    return registros, corrompidos
+
+
+def colocar_em_quarentena(caminho, itens):
+    """
+    Acrescenta itens ilegíveis ou inválidos ao arquivo de quarentena,
+    um objeto JSON por linha, para análise ou restauração manual.
+
+    Args:
+        caminho (str): Caminho do arquivo de quarentena.
+        itens (list): Dicionários descrevendo cada item descartado.
+    """
+    with open(caminho, "a", encoding="utf-8") as f:
+        for item in itens:
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+
+def decodificar_tarefas(registros):
+    """
+    Converte registros em objetos Tarefa.
+
+    Um registro inválido é reportado individualmente em vez de invalidar
+    todo o arquivo. A validação é feita no próprio processo: construir os
+    objetos Tarefa é a maior parte do custo da carga e precisa acontecer no
+    processo que os usa, então dividi-la com um pool de processos só
+    acrescenta o custo de envio (veja benchmarks/bench_carregamento.py).
+
+    Args:
+        registros (list): Registros (dicionários) lidos do arquivo.
+
+    Returns:
+        tuple: (lista de (posição, Tarefa), lista de (posição, mensagem de erro)).
+    """
+    if not isinstance(registros, list):
+        raise ValueError("O arquivo deve conter uma lista de tarefas.")
+    validos = []
+    erros = []
+    for posicao, data in enumerate(registros):
+        try:
+            validos.append((posicao, Tarefa.from_dict(data)))
+        except (ValueError, KeyError, TypeError) as e:
+            erros.append((posicao, f"{type(e).__name__}: {e}"))
+    return validos, erros
+
+
+def indice_do_fragmento(id_tarefa, num_fragmentos):
+    """
+    Calcula em qual fragmento uma tarefa deve ser armazenada.
+
+    Usa CRC32 em vez de hash() porque o hash de strings do Python muda
+    a cada execução, e o fragmento de uma tarefa precisa ser estável.
+
+    Args:
+        id_tarefa (str): O ID da tarefa.
+        num_fragmentos (int): Quantidade total de fragmentos.
+
+    Returns:
+        int: Índice do fragmento, entre 0 e num_fragmentos - 1.
+    """
+    return zlib.crc32(id_tarefa.encode("utf-8")) % num_fragmentos
+
+
+def caminho_do_fragmento(arquivo_json, indice):
+    """
+    Retorna o nome do arquivo de um fragmento.
+    Ex.: ("tarefas.json", 3) -> "tarefas.3.json".
+    """
+    base, extensao = os.path.splitext(arquivo_json)
+    return f"{base}.{indice}{extensao}"
+
+
+def carregar_fragmentos(arquivo_json, num_fragmentos, max_workers=None):
+    """
+    Carrega todos os fragmentos em paralelo e os mescla em ordem estável.
+
+    Cada registro de fragmento carrega o campo "ordem", atribuído na inserção.
+    Como cada fragmento é gravado em ordem crescente, a mescla é feita com
+    heapq.merge, sem precisar ordenar a lista completa.
+
+    Args:
+        arquivo_json (str): Nome base do arquivo de tarefas.
+        num_fragmentos (int): Quantidade de fragmentos.
+        max_workers (int, optional): Número máximo de threads de leitura.
+
+    Returns:
+        tuple: (registros de todos os fragmentos em ordem, trechos corrompidos).
+
+    Raises:
+        FileNotFoundError: Se nenhum arquivo de fragmento existir.
+    """
+    caminhos = [caminho_do_fragmento(arquivo_json, i) for i in range(num_fragmentos)]
+    existentes = [c for c in caminhos if os.path.exists(c)]
+    if not existentes:
+        raise FileNotFoundError(caminhos[0])
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(existentes), 8)) as executor:
+        lidos = list(executor.map(ler_registros, existentes))
+
+    fragmentos = []
+    corrompidos = [trecho for _, trechos in lidos for trecho in trechos]
+    for caminho, (registros, _) in zip(existentes, lidos):
+        indice = caminhos.index(caminho)
+        no_lugar = []
+        for posicao, registro in enumerate(registros):
+            id_tarefa = registro.get("id") if isinstance(registro, dict) else None
+            if isinstance(id_tarefa, str) and indice_do_fragmento(id_tarefa, num_fragmentos) != indice:
+                # Gravado com outra quantidade de fragmentos: não é confiável
+                corrompidos.append({"posicao": posicao, "registro": registro,
+                                    "erro": f"Registro de outro fragmento encontrado em {caminho}."})
+            else:
+                no_lugar.append(registro)
+        fragmentos.append(no_lugar)
+    ordenados = heapq.merge(*fragmentos, key=_ordem_do_registro)
+    return list(ordenados), corrompidos
+
+
+def _ordem_do_registro(registro):
+    """Ordem de inserção de um registro de fragmento (registros inválidos vão ao início)."""
+    ordem = registro.get("ordem", 0) if isinstance(registro, dict) else 0
+    return ordem if isinstance(ordem, int) else 0
+
+
+def caminho_do_manifesto(arquivo_json):
+    """Retorna o arquivo que registra a quantidade de fragmentos do armazenamento."""
+    return f"{arquivo_json}.fragmentos"
+
+
+def ler_num_fragmentos(arquivo_json):
+    """
+    Lê a quantidade de fragmentos registrada no manifesto.
+
+    Returns:
+        int or None: A quantidade, ou None se não houver manifesto.
+
+    Raises:
+        ValueError: Se o manifesto estiver ilegível.
+    """
+    try:
+        with open(caminho_do_manifesto(arquivo_json), "r", encoding="utf-8") as f:
+            num_fragmentos = json.load(f)["num_fragmentos"]
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"Manifesto {caminho_do_manifesto(arquivo_json)} ilegível: {e}") from None
+    if not isinstance(num_fragmentos, int) or isinstance(num_fragmentos, bool) or num_fragmentos < 1:
+        raise ValueError(f"Manifesto {caminho_do_manifesto(arquivo_json)} ilegível: {num_fragmentos!r}")
+    return num_fragmentos
+
+
+def gravar_num_fragmentos(arquivo_json, num_fragmentos):
+    """Registra a quantidade de fragmentos do armazenamento no manifesto."""
+    escrever_json(caminho_do_manifesto(arquivo_json), {"num_fragmentos": num_fragmentos})
+
+
+def _descrever_layout(num_fragmentos):
+    """Descreve uma quantidade de fragmentos para as mensagens de erro."""
+    return f"{num_fragmentos} fragmento(s)" if num_fragmentos else "arquivo único"
+
+
+def verificar_num_fragmentos(arquivo_json, num_fragmentos):
+    """
+    Verifica se a quantidade de fragmentos corresponde aos arquivos no disco.
+
+    Abrir o armazenamento com a quantidade errada espalharia as tarefas
+    pelos fragmentos errados, então a divergência é recusada. Usa o manifesto
+    quando existe e, em armazenamentos antigos, os arquivos encontrados.
+
+    Args:
+        arquivo_json (str): Nome base do arquivo de tarefas.
+        num_fragmentos (int or None): Quantidade informada (None ou 0 = arquivo único).
+
+    Raises:
+        ValueError: Se a quantidade não corresponder ao armazenamento.
+    """
+    num_fragmentos = num_fragmentos or None
+    registrado = ler_num_fragmentos(arquivo_json)
+    existentes = fragmentos_existentes(arquivo_json)
+    if registrado is not None:
+        correto = registrado == num_fragmentos
+        atual = _descrever_layout(registrado)
+    elif existentes:
+        # Sem manifesto (armazenamento antigo): há pelo menos esta quantidade
+        minimo = max(existentes) + 1
+        correto = num_fragmentos is not None and num_fragmentos >= minimo
+        atual = f"pelo menos {_descrever_layout(minimo)}"
+    elif os.path.exists(arquivo_json):
+        correto = num_fragmentos is None
+        atual = _descrever_layout(None)
+    else:
+        return # Armazenamento novo
+    if not correto:
+        raise ValueError(f"O armazenamento {arquivo_json} está em {atual}, "
+                         f"mas foi aberto com {_descrever_layout(num_fragmentos)}.")
+
+
+def fragmentos_existentes(arquivo_json):
+    """
+    Retorna os índices dos arquivos de fragmento que existem no disco.
+
+    Args:
+        arquivo_json (str): Nome base do arquivo de tarefas.
+
+    Returns:
+        set: Índices encontrados (ex.: {0, 1, 2} para tarefas.0.json ... tarefas.2.json).
+    """
+    diretorio = os.path.dirname(arquivo_json) or "."
+    base, extensao = os.path.splitext(os.path.basename(arquivo_json))
+    padrao = re.compile(re.escape(base) + r"\.(\d+)" + re.escape(extensao) + "$")
+    indices = set()
+    for nome in os.listdir(diretorio):
+        encontrado = padrao.match(nome)
+        if encontrado:
+            indices.add(int(encontrado.group(1)))
+    return indices
+
+
+def _validar_num_fragmentos(valor, nome):
+    """Aceita None/0 (arquivo único) ou um inteiro positivo."""
+    if valor is None:
+        return
+    if not isinstance(valor, int) or isinstance(valor, bool) or valor < 0:
+        raise ValueError(f"{nome} deve ser um número inteiro positivo (ou omitido para arquivo único).")
+
+
+def refragmentar(arquivo_json, num_atual, num_novo, formato=None):
+    """
+    Redistribui as tarefas entre uma nova quantidade de fragmentos.
+    Operação offline: nenhum gerenciador deve estar usando os arquivos.
+
+    Um valor None (ou 0) para num_atual/num_novo representa o arquivo único.
+    O novo conjunto de arquivos é gravado inteiro com nomes temporários
+    (sufixo ".novo"); só então os arquivos antigos são renomeados para
+    ".antigo", os novos assumem os nomes definitivos e os antigos são
+    removidos. Se a operação for interrompida, um conjunto completo (antigo
+    ou novo) sempre permanece no disco.
+
+    Args:
+        arquivo_json (str): Nome base do arquivo de tarefas.
+        num_atual (int or None): Quantidade atual de fragmentos.
+        num_novo (int or None): Nova quantidade de fragmentos.
+        formato (str, optional): Formato dos novos arquivos. Defaults to None
+                                 (mantém o formato dos arquivos atuais).
+
+    Returns:
+        int: Quantidade de tarefas redistribuídas.
+
+    Raises:
+        ValueError: Se as quantidades forem inválidas, se num_atual não corresponder
+                    ao armazenamento (veja verificar_num_fragmentos) ou se algum
+                    arquivo estiver corrompido ou tiver registros inválidos.
+    """
+    _validar_num_fragmentos(num_atual, "A quantidade atual de fragmentos")
+    _validar_num_fragmentos(num_novo, "A nova quantidade de fragmentos")
+
+    try:
+        verificar_num_fragmentos(arquivo_json, num_atual)
+    except ValueError as e:
+        raise ValueError(f"{e} Verifique o valor de --de.") from None
+    existentes = fragmentos_existentes(arquivo_json)
+
+    if num_atual:
+        registros, corrompidos = carregar_fragmentos(arquivo_json, num_atual)
+        antigos = [caminho_do_fragmento(arquivo_json, i) for i in sorted(existentes)]
+    else:
+        registros, corrompidos = ler_registros(arquivo_json)
+        antigos = [arquivo_json]
+    _, invalidos = decodificar_tarefas(registros)
+    if corrompidos or invalidos:
+        raise ValueError(f"há {len(corrompidos) + len(invalidos)} registro(s) corrompido(s) ou inválido(s); "
+                         f"abra o armazenamento no gerenciador para recuperá-lo antes")
+    if formato is None:
+        formato = next(filter(None, map(detectar_formato, antigos)), "json")
+
+    if num_novo:
+        registros = [dict(registro, ordem=ordem) for ordem, registro in enumerate(registros)]
+        novos = {caminho_do_fragmento(arquivo_json, i): [] for i in range(num_novo)}
+        for registro in registros:
+            indice = indice_do_fragmento(registro["id"], num_novo)
+            novos[caminho_do_fragmento(arquivo_json, indice)].append(registro)
+    else:
+        novos = {arquivo_json: [{k: v for k, v in registro.items() if k != "ordem"}
+                                for registro in registros]}
+    # O manifesto é trocado junto com os arquivos que descreve
+    manifesto = caminho_do_manifesto(arquivo_json)
+    antigos.append(manifesto)
+    if num_novo:
+        novos[manifesto] = {"num_fragmentos": num_novo}
+
+    for caminho, dados in novos.items():
+        escrever_json(f"{caminho}.novo", dados, formato="json" if caminho == manifesto else formato)
+    for caminho in antigos:
+        if os.path.exists(caminho):
+            os.replace(caminho, f"{caminho}.antigo")
+    for caminho in novos:
+        os.replace(f"{caminho}.novo", caminho)
+    for caminho in antigos:
+        if os.path.exists(f"{caminho}.antigo"):
+            os.remove(f"{caminho}.antigo")
+    return len(registros)
@@ -0,0 +1,182 @@
+# gerenciador_tarefas/recorrencia.py
+
+import calendar
+import uuid
+from datetime import date, timedelta
+from .tarefa import Tarefa
+
+# Frequências suportadas e o passo de cada uma em dias (mensal é tratada à parte)
+FREQUENCIAS = {"diaria": 1, "semanal": 7, "mensal": None}
+
+# Separa o ID da regra da data no ID de uma ocorrência (ex.: "<regra>@2025-01-31")
+SEPARADOR_OCORRENCIA = "@"
+
+
+def converter_data(valor):
+    """
+    Converte uma data no formato YYYY-MM-DD (ou um objeto date) para date.
+
+    Raises:
+        ValueError: Se o valor não for uma data válida.
+    """
+    if isinstance(valor, date):
+        return valor
+    if not isinstance(valor, str):
+        raise ValueError(f"Data inválida: {valor!r}. Use o formato YYYY-MM-DD.")
+    try:
+        return date.fromisoformat(valor)
+    except ValueError:
+        raise ValueError(f"Data inválida: {valor!r}. Use o formato YYYY-MM-DD.") from None
+
+
+class RegraDeRecorrencia:
+    """
+    Regra que gera uma tarefa a cada dia, semana ou mês a partir de uma data.
+
+    A regra guarda apenas seus parâmetros e as datas das ocorrências já
+    concluídas; as tarefas de cada ocorrência só são criadas quando um
+    intervalo de datas é consultado.
+    """
+    def __init__(self, descricao, data_inicio, frequencia, intervalo=1, data_fim=None,
+                 id_regra=None, concluidas=None):
+        """
+        Inicializa uma regra de recorrência.
+
+        Args:
+            descricao (str): A descrição das tarefas geradas.
+            data_inicio (str or date): Data da primeira ocorrência (YYYY-MM-DD).
+            frequencia (str): "diaria", "semanal" ou "mensal".
+            intervalo (int, optional): Repete a cada N dias/semanas/meses. Defaults to 1.
+            data_fim (str or date, optional): Última data possível. Defaults to None (sem fim).
+            id_regra (str, optional): O ID da regra. Se None, um novo UUID será gerado.
+            concluidas (iterable, optional): Datas (YYYY-MM-DD) das ocorrências concluídas.
+
+        Raises:
+            ValueError: Se algum parâmetro for inválido.
+        """
+        if not descricao or not isinstance(descricao, str):
+            raise ValueError("A descrição da tarefa não pode ser vazia e deve ser uma string.")
+        if frequencia not in FREQUENCIAS:
+            raise ValueError(f"Frequência inválida: {frequencia}. Use um de {', '.join(FREQUENCIAS)}.")
+        if not isinstance(intervalo, int) or isinstance(intervalo, bool) or intervalo < 1:
+            raise ValueError("O intervalo deve ser um número inteiro maior que zero.")
+
+        self.id = id_regra if id_regra else str(uuid.uuid4())
+        self.descricao = descricao
+        self.data_inicio = converter_data(data_inicio)
+        self.frequencia = frequencia
+        self.intervalo = intervalo
+        self.data_fim = converter_data(data_fim) if data_fim else None
+        if self.data_fim and self.data_fim < self.data_inicio:
+            raise ValueError("A data final não pode ser anterior à data inicial.")
+        self.concluidas = set(concluidas or [])
+
+    def _ocorrencia(self, indice):
+        """Retorna a data da ocorrência de número indice (a primeira é 0)."""
+        if self.frequencia != "mensal":
+            return self.data_inicio + timedelta(days=indice * self.intervalo * FREQUENCIAS[self.frequencia])
+        meses = self.data_inicio.month - 1 + indice * self.intervalo
+        ano = self.data_inicio.year + meses // 12
+        mes = meses % 12 + 1
+        # Dia 31 em meses mais curtos vira o último dia do mês
+        dia = min(self.data_inicio.day, calendar.monthrange(ano, mes)[1])
+        return date(ano, mes, dia)
+
+    def _primeiro_indice_a_partir_de(self, inicio):
+        """
+        Estima o índice da primeira ocorrência em ou após inicio sem percorrer
+        as anteriores. Pode ficar uma posição antes; ocorrencias() corrige.
+        """
+        if inicio <= self.data_inicio:
+            return 0
+        if self.frequencia != "mensal":
+            passo = self.intervalo * FREQUENCIAS[self.frequencia]
+            return -(-(inicio - self.data_inicio).days // passo)
+        meses = (inicio.year - self.data_inicio.year) * 12 + inicio.month - self.data_inicio.month
+        return max(0, meses // self.intervalo)
+
+    def ocorrencias(self, inicio, fim):
+        """
+        Gera as datas das ocorrências no intervalo [inicio, fim].
+
+        Args:
+            inicio (str or date): Primeira data do intervalo.
+            fim (str or date): Última data do intervalo.
+
+        Yields:
+            date: As datas das ocorrências, em ordem crescente.
+        """
+        inicio = converter_data(inicio)
+        fim = converter_data(fim)
+        if self.data_fim and self.data_fim < fim:
+            fim = self.data_fim
+        indice = self._primeiro_indice_a_partir_de(inicio)
+        while True:
+            try:
+                data = self._ocorrencia(indice)
+            except (OverflowError, ValueError):
+                return # A próxima ocorrência passaria de 9999-12-31
+            if data > fim:
+                return
+            if data >= inicio:
+                yield data
+            indice += 1
+
+    def tarefas_entre(self, inicio, fim):
+        """
+        Gera as tarefas das ocorrências no intervalo [inicio, fim].
+        O ID de cada tarefa é "<id da regra>@<data>".
+
+        Yields:
+            Tarefa: Uma tarefa por ocorrência, em ordem de data.
+        """
+        for data in self.ocorrencias(inicio, fim):
+            data_str = data.isoformat()
+            yield Tarefa(
+                self.descricao,
+                data_str,
+                id_tarefa=f"{self.id}{SEPARADOR_OCORRENCIA}{data_str}",
+                concluida=data_str in self.concluidas,
+            )
+
+    def e_ocorrencia(self, data):
+        """Verifica se a data corresponde a uma ocorrência da regra."""
+        data = converter_data(data)
+        return any(True for _ in self.ocorrencias(data, data))
+
+    def to_dict(self):
+        """
+        Converte a regra para um dicionário, útil para serialização JSON.
+        """
+        return {
+            "id": self.id,
+            "descricao": self.descricao,
+            "data_inicio": self.data_inicio.isoformat(),
+            "frequencia": self.frequencia,
+            "intervalo": self.intervalo,
+            "data_fim": self.data_fim.isoformat() if self.data_fim else None,
+            "concluidas": sorted(self.concluidas),
+        }
+
+    @classmethod
+    def from_dict(cls, data_dict):
+        """
+        Cria uma regra a partir de um dicionário.
+        """
+        if not isinstance(data_dict, dict):
+            raise ValueError("Os dados de entrada devem ser um dicionário.")
+
+        obrigatorias = ["id", "descricao", "data_inicio", "frequencia"]
+        for chave in obrigatorias:
+            if chave not in data_dict:
+                raise KeyError(chave)
+
+        return cls(
+            descricao=data_dict["descricao"],
+            data_inicio=data_dict["data_inicio"],
+            frequencia=data_dict["frequencia"],
+            intervalo=data_dict.get("intervalo", 1),
+            data_fim=data_dict.get("data_fim"),
+            id_regra=data_dict["id"],
+            concluidas=data_dict.get("concluidas"),
+        )
@@ -1,6 +1,11 @@
 # main.py
 
+import argparse
+import sys
+
 from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.persistencia import FORMATOS, refragmentar
+from gerenciador_tarefas.recorrencia import FREQUENCIAS
 
 def adicionar_tarefa(gerenciador):
     descricao = input("Digite a descrição da tarefa: ")
@@ -68,5 +73,134 @@ def main():
             if escolha != "5":
                 print("Opção inválida. Por favor, tente novamente.")
 
+def quantidade_de_fragmentos(valor):
+    """Tipo do argparse para quantidades de fragmentos: inteiro não negativo (0 = arquivo único)."""
+    try:
+        quantidade = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"quantidade inválida: {valor!r}") from None
+    if quantidade < 0:
+        raise argparse.ArgumentTypeError(f"a quantidade de fragmentos não pode ser negativa: {quantidade}")
+    return quantidade
+
+def limite_de_tarefas(valor):
+    """Tipo do argparse para o limite da listagem: inteiro não negativo."""
+    try:
+        limite = int(valor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"limite inválido: {valor!r}") from None
+    if limite < 0:
+        raise argparse.ArgumentTypeError(f"o limite não pode ser negativo: {limite}")
+    return limite
+
+def criar_parser():
+    """Cria o parser dos comandos de linha de comando (não interativos)."""
+    parser = argparse.ArgumentParser(description="Gerenciador de Tarefas")
+    parser.add_argument("--arquivo", default="tarefas.json", help="Arquivo JSON de tarefas.")
+    parser.add_argument("--formato", choices=FORMATOS, default=None,
+                        help="Formato de gravação (padrão: o formato atual do arquivo, ou json).")
+    parser.add_argument("--fragmentos", type=quantidade_de_fragmentos, default=None,
+                        help="Quantidade de fragmentos do armazenamento (omita ou use 0 para arquivo único).")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    p_refragmentar = subparsers.add_parser(
+        "refragmentar", help="Redistribui as tarefas entre N arquivos (operação offline)."
+    )
+    p_refragmentar.add_argument("--de", type=quantidade_de_fragmentos, default=None,
+                                help="Quantidade atual de fragmentos (padrão: --fragmentos; "
+                                     "0 para arquivo único).")
+    p_refragmentar.add_argument("--para", type=quantidade_de_fragmentos, default=None,
+                                help="Nova quantidade de fragmentos (omita ou use 0 para arquivo único).")
+    # SUPPRESS: sem --formato aqui, vale o --formato global
+    p_refragmentar.add_argument("--formato", choices=FORMATOS, default=argparse.SUPPRESS,
+                                help="Formato dos novos arquivos (padrão: o formato atual).")
+
+    p_listar = subparsers.add_parser("listar", help="Lista as tarefas.")
+    p_listar.add_argument("--ordenar", default=None,
+                          help="Campos de ordenação separados por vírgula: vencimento, status, "
+                               "descricao, criacao. Use '-' para ordem decrescente "
+                               "(ex.: --ordenar=-vencimento,descricao).")
+    p_listar.add_argument("--limite", type=limite_de_tarefas, default=None,
+                          help="Quantidade máxima de tarefas listadas.")
+    p_listar.add_argument("--de", dest="inicio", default=None,
+                          help="Com --ate, lista só as tarefas que vencem no intervalo "
+                               "(YYYY-MM-DD), incluindo as ocorrências das recorrências.")
+    p_listar.add_argument("--ate", dest="fim", default=None,
+                          help="Última data do intervalo (YYYY-MM-DD).")
+
+    p_recorrencia = subparsers.add_parser("adicionar-recorrencia", help="Adiciona uma tarefa recorrente.")
+    p_recorrencia.add_argument("descricao", help="Descrição das tarefas geradas.")
+    p_recorrencia.add_argument("--inicio", required=True, help="Data da primeira ocorrência (YYYY-MM-DD).")
+    p_recorrencia.add_argument("--frequencia", required=True, choices=list(FREQUENCIAS),
+                               help="Frequência das ocorrências.")
+    p_recorrencia.add_argument("--intervalo", type=int, default=1,
+                               help="Repete a cada N dias/semanas/meses (padrão: 1).")
+    p_recorrencia.add_argument("--fim", default=None, help="Última data possível (YYYY-MM-DD).")
+
+    p_remover_recorrencia = subparsers.add_parser("remover-recorrencia",
+                                                  help="Remove uma tarefa recorrente.")
+    p_remover_recorrencia.add_argument("id", help="ID da recorrência.")
+
+    p_ocorrencia = subparsers.add_parser("concluir-ocorrencia",
+                                         help="Marca uma ocorrência de uma recorrência como concluída.")
+    p_ocorrencia.add_argument("id", help="ID da ocorrência (<id da recorrência>@YYYY-MM-DD).")
+    p_ocorrencia.add_argument("--reabrir", action="store_true",
+                              help="Marca a ocorrência como pendente novamente.")
+
+    subparsers.add_parser("desfazer", help="Desfaz a última operação.")
+    subparsers.add_parser("refazer", help="Refaz a última operação desfeita.")
+    return parser
+
+def abrir_gerenciador(args):
+    """Cria o gerenciador com as opções globais da linha de comando."""
+    return GerenciadorDeTarefas(arquivo_json=args.arquivo, num_fragmentos=args.fragmentos or None,
+                                formato=args.formato)
+
+def executar_comando(argv):
+    """Executa um comando não interativo. Retorna o código de saída."""
+    args = criar_parser().parse_args(argv)
+
+    if args.comando == "refragmentar":
+        de = args.fragmentos if args.de is None else args.de
+        try:
+            total = refragmentar(args.arquivo, de, args.para, args.formato)
+        except (IOError, ValueError) as e:
+            print(f"Erro ao refragmentar {args.arquivo}: {e}")
+            return 1
+        print(f"{total} tarefas redistribuídas.")
+        return 0
+
+    try:
+        gerenciador = abrir_gerenciador(args)
+    except ValueError as e:
+        print(f"Erro ao abrir {args.arquivo}: {e}")
+        return 1
+    if args.comando == "listar":
+        try:
+            linhas = gerenciador.visualizar_tarefas(ordenar_por=args.ordenar, limite=args.limite,
+                                                    inicio=args.inicio, fim=args.fim)
+        except ValueError as e:
+            print(f"Erro: {e}")
+            return 1
+        for linha in linhas:
+            print(linha)
+    elif args.comando == "adicionar-recorrencia":
+        regra = gerenciador.adicionar_recorrencia(args.descricao, args.inicio, args.frequencia,
+                                                  args.intervalo, args.fim)
+        if regra is None:
+            return 1
+        print(f"ID da recorrência: {regra.id}")
+    elif args.comando == "remover-recorrencia":
+        return 0 if gerenciador.remover_recorrencia(args.id) else 1
+    elif args.comando == "concluir-ocorrencia":
+        return 0 if gerenciador.marcar_ocorrencia_como_concluida(args.id, not args.reabrir) else 1
+    elif args.comando == "desfazer":
+        return 0 if gerenciador.desfazer() else 1
+    elif args.comando == "refazer":
+        return 0 if gerenciador.refazer() else 1
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(executar_comando(sys.argv[1:]))
     main()
\ No newline at end of file
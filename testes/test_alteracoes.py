@@ -0,0 +1,105 @@
+# testes/test_alteracoes.py
+
+import json
+import pytest
+from gerenciador_tarefas.alteracoes import FluxoDeAlteracoes, ler_alteracoes
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.tarefa import Tarefa
+
+
+class TestFluxoDeAlteracoes:
+    """
+    Conjunto de testes para o fluxo de alterações das tarefas.
+    """
+
+    def test_gerenciador_publica_eventos_com_sequencia_crescente(self, tmp_path):
+        """Testa que cada mutação gera um evento do tipo correto, em ordem."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        eventos = []
+        gerenciador.alteracoes.assinar(eventos.append)
+
+        tarefa = gerenciador.adicionar_tarefa("Tarefa observada")
+        gerenciador.marcar_tarefa_como_concluida(tarefa.id)
+        gerenciador.marcar_tarefa_como_pendente(tarefa.id)
+        gerenciador.remover_tarefa(tarefa.id)
+
+        assert [e["tipo"] for e in eventos] == ["adicionada", "concluida", "reaberta", "removida"]
+        assert [e["seq"] for e in eventos] == [1, 2, 3, 4]
+        assert eventos[1]["tarefa"]["concluida"] is True
+        assert all(e["tarefa"]["id"] == tarefa.id for e in eventos)
+
+    def test_operacao_sem_efeito_nao_publica_evento(self, tmp_path):
+        """Testa que reabrir uma tarefa pendente não gera evento."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        tarefa = gerenciador.adicionar_tarefa("Tarefa pendente")
+        eventos = []
+        gerenciador.alteracoes.assinar(eventos.append)
+
+        assert gerenciador.marcar_tarefa_como_pendente(tarefa.id) is False
+        assert eventos == []
+
+    def test_cancelar_assinatura(self):
+        """Testa que um assinante removido deixa de receber eventos."""
+        fluxo = FluxoDeAlteracoes()
+        eventos = []
+        callback = fluxo.assinar(eventos.append)
+        fluxo.publicar("adicionada", Tarefa("A"))
+        assert fluxo.cancelar_assinatura(callback) is True
+        fluxo.publicar("adicionada", Tarefa("B"))
+        assert len(eventos) == 1
+        assert fluxo.cancelar_assinatura(callback) is False
+
+    def test_tipo_invalido_levanta_erro(self):
+        """Testa que um tipo de evento desconhecido é rejeitado."""
+        with pytest.raises(ValueError, match="Tipo de alteração inválido"):
+            FluxoDeAlteracoes().publicar("editada", Tarefa("A"))
+
+    def test_leitor_externo_acompanha_a_partir_de_sequencia(self, tmp_path):
+        """Testa a leitura incremental do arquivo entre sessões do gerenciador."""
+        arquivo = str(tmp_path / "tarefas.json")
+        arquivo_alteracoes = str(tmp_path / "alteracoes.jsonl")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, arquivo_alteracoes=arquivo_alteracoes)
+        gerenciador.adicionar_tarefa("Primeira")
+        gerenciador.adicionar_tarefa("Segunda")
+
+        # Uma nova sessão continua a numeração do arquivo
+        nova_sessao = GerenciadorDeTarefas(arquivo_json=arquivo, arquivo_alteracoes=arquivo_alteracoes)
+        terceira = nova_sessao.adicionar_tarefa("Terceira")
+
+        eventos = list(ler_alteracoes(arquivo_alteracoes, a_partir_de=2))
+        assert [e["seq"] for e in eventos] == [3]
+        assert eventos[0]["tarefa"]["id"] == terceira.id
+        assert len(list(ler_alteracoes(arquivo_alteracoes))) == 3
+
+    def test_leitura_a_partir_de_sequencia_igual_a_leitura_completa(self, tmp_path):
+        """Testa a busca binária com linhas inválidas espalhadas pelo arquivo."""
+        arquivo = tmp_path / "alteracoes.jsonl"
+        linhas = []
+        for seq in range(1, 201):
+            linhas.append(json.dumps({"seq": seq, "tipo": "adicionada", "tarefa": {"id": str(seq)}}))
+            if seq % 17 == 0:
+                linhas.append('{"seq": 999, "tipo": "trunc')
+            if seq % 23 == 0:
+                linhas.append("5")
+        arquivo.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+
+        for a_partir_de in (0, 1, 16, 17, 100, 199, 200, 500):
+            eventos = list(ler_alteracoes(str(arquivo), a_partir_de=a_partir_de))
+            assert [e["seq"] for e in eventos] == list(range(a_partir_de + 1, 201))
+
+    def test_leitura_nao_le_o_arquivo_inteiro(self, tmp_path, monkeypatch):
+        """Testa que buscar os últimos eventos interpreta poucas linhas."""
+        import gerenciador_tarefas.alteracoes as alteracoes
+        arquivo = tmp_path / "alteracoes.jsonl"
+        arquivo.write_text("".join(json.dumps({"seq": seq}) + "\n" for seq in range(1, 10001)),
+                           encoding="utf-8")
+
+        interpretadas = []
+        interpretar_original = alteracoes._interpretar_linha
+        def contar(linha):
+            interpretadas.append(linha)
+            return interpretar_original(linha)
+        monkeypatch.setattr(alteracoes, "_interpretar_linha", contar)
+
+        assert [e["seq"] for e in ler_alteracoes(str(arquivo), a_partir_de=9998)] == [9999, 10000]
+        assert len(interpretadas) < 100
@@ -0,0 +1,90 @@
+# testes/test_identificadores.py
+
+import uuid
+import pytest
+from datetime import datetime, timedelta, timezone
+from gerenciador_tarefas.identificadores import (
+    GeradorUUIDv7,
+    criar_gerador,
+    instante_de_criacao,
+)
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+class TestIdentificadores:
+    """
+    Conjunto de testes para a geração de IDs das tarefas.
+    """
+
+    def test_uuid7_e_um_uuid_valido(self):
+        """Testa que o ID gerado é um UUID versão 7 com a variante RFC 4122."""
+        id_gerado = GeradorUUIDv7()()
+        convertido = uuid.UUID(id_gerado)
+        assert str(convertido) == id_gerado
+        assert convertido.version == 7
+        assert convertido.variant == uuid.RFC_4122
+
+    def test_uuid7_e_crescente_e_unico(self):
+        """Testa que IDs gerados em sequência são únicos e ordenados."""
+        ids = GeradorUUIDv7(tamanho_buffer=64).gerar_lote(20000)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_instante_de_criacao(self):
+        """Testa a extração do instante de criação de um UUIDv7."""
+        antes = datetime.now(timezone.utc) - timedelta(seconds=1)
+        instante = instante_de_criacao(GeradorUUIDv7()())
+        assert antes <= instante <= datetime.now(timezone.utc) + timedelta(seconds=1)
+        assert instante_de_criacao(str(uuid.uuid4())) is None
+
+    def test_esquema_invalido_levanta_erro(self):
+        """Testa que um esquema desconhecido é rejeitado."""
+        with pytest.raises(ValueError, match="Esquema de ID inválido"):
+            criar_gerador("sequencial")
+
+    def test_gerenciador_com_uuid7_convive_com_ids_antigos(self, tmp_path):
+        """Testa que um arquivo com IDs UUID4 continua válido ao trocar de esquema."""
+        arquivo = str(tmp_path / "tarefas.json")
+        antiga = GerenciadorDeTarefas(arquivo_json=arquivo).adicionar_tarefa("Tarefa antiga")
+
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, esquema_id="uuid7")
+        nova = gerenciador.adicionar_tarefa("Tarefa nova")
+        assert uuid.UUID(nova.id).version == 7
+        assert gerenciador.encontrar_tarefa_por_id(antiga.id) is not None
+
+        agora = datetime.now(timezone.utc)
+        criadas = gerenciador.tarefas_criadas_entre(agora - timedelta(minutes=1), agora + timedelta(minutes=1))
+        assert [t.id for t in criadas] == [nova.id]
+        assert gerenciador.tarefas_criadas_entre(fim=agora - timedelta(minutes=1)) == []
+
+    def test_contador_usa_bytes_proprios(self, monkeypatch):
+        """Testa que a semente do contador não repete bits da parte aleatória do ID."""
+        import gerenciador_tarefas.identificadores as identificadores
+        buffer = bytes(range(1, 33))
+        monkeypatch.setattr(identificadores.os, "urandom", lambda n: buffer[:n])
+
+        valor = uuid.UUID(GeradorUUIDv7(tamanho_buffer=32)()).int
+        assert (valor >> 64) & 0xFFF == int.from_bytes(buffer[8:10], "big") >> 5
+        assert valor & ((1 << 62) - 1) == int.from_bytes(buffer[:8], "big") & ((1 << 62) - 1)
+
+    def test_tarefas_criadas_entre_usa_indice_ordenado(self, tmp_path, monkeypatch):
+        """Testa a consulta por data de criação após adições, remoções e recarga."""
+        import gerenciador_tarefas.identificadores as identificadores
+        arquivo = str(tmp_path / "tarefas.json")
+        relogio = iter(range(1_700_000_000_000, 1_700_000_000_000 + 10_000, 100))
+        monkeypatch.setattr(identificadores.time, "time_ns", lambda: next(relogio) * 1_000_000)
+
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, esquema_id="uuid7")
+        tarefas = [gerenciador.adicionar_tarefa(f"Tarefa {i}") for i in range(10)]
+        gerenciador.remover_tarefa(tarefas[4].id)
+        gerenciador.desfazer()
+        gerenciador.remover_tarefa(tarefas[6].id)
+
+        def instante(ms):
+            return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+        inicio, fim = instante(1_700_000_000_300), instante(1_700_000_000_800)
+        esperadas = [t.id for t in tarefas[3:8] if t is not tarefas[6]]
+        assert [t.id for t in gerenciador.tarefas_criadas_entre(inicio, fim)] == esperadas
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo)
+        assert [t.id for t in recarregado.tarefas_criadas_entre(inicio, fim)] == esperadas
+        assert len(recarregado.tarefas_criadas_entre()) == 9
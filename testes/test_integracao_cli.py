@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import glob
 import io
 import json
 import re
@@ -29,14 +30,15 @@ def ambiente_limpo(monkeypatch):
     monkeypatch.setattr(GerenciadorDeTarefas, '__init__', patched_init)
 
     # Garante que o ambiente esteja limpo ANTES do teste
-    if os.path.exists(ARQUIVO_TESTE):
-        os.remove(ARQUIVO_TESTE)
+    # (inclui derivados como cópias de segurança: tarefas_teste.json.1, ...)
+    for caminho in glob.glob(f"{ARQUIVO_TESTE}*"):
+        os.remove(caminho)
 
     yield # O teste é executado aqui
 
     # Limpa o ambiente DEPOIS do teste
-    if os.path.exists(ARQUIVO_TESTE):
-        os.remove(ARQUIVO_TESTE)
+    for caminho in glob.glob(f"{ARQUIVO_TESTE}*"):
+        os.remove(caminho)
 
 def simular_execucao(monkeypatch, inputs):
     """
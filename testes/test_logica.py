@@ -2,6 +2,7 @@
 
 import pytest
 import os
+import glob
 import json
 from gerenciador_tarefas.logica import GerenciadorDeTarefas
 from gerenciador_tarefas.tarefa import Tarefa
@@ -9,11 +10,15 @@ from gerenciador_tarefas.tarefa import Tarefa
 # Define um nome de arquivo de teste para não interferir com o arquivo padrão
 ARQUIVO_TESTE_JSON = "tarefas_teste.json"
 
+def remover_arquivos(arquivo_json):
+    """Remove o arquivo de teste e seus derivados (cópias de segurança, quarentena)."""
+    for caminho in glob.glob(f"{arquivo_json}*"):
+        os.remove(caminho)
+
 @pytest.fixture
 def gerenciador_vazio():
     """Fixture para criar um GerenciadorDeTarefas com um arquivo de teste limpo."""
-    if os.path.exists(ARQUIVO_TESTE_JSON):
-        os.remove(ARQUIVO_TESTE_JSON)
+    remover_arquivos(ARQUIVO_TESTE_JSON)
     gerenciador = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
     return gerenciador
 
@@ -192,8 +197,7 @@ class TestGerenciadorDeTarefas:
         captured = capsys.readouterr()
         assert f"Erro ao decodificar JSON do arquivo {nome_arquivo_corrompido}" in captured.out
 
-        if os.path.exists(nome_arquivo_corrompido):
-            os.remove(nome_arquivo_corrompido)
+        remover_arquivos(nome_arquivo_corrompido)
             
     def test_limpar_todas_as_tarefas(self, gerenciador_com_tarefas, capsys):
         """Testa a funcionalidade de limpar todas as tarefas."""
@@ -267,9 +271,115 @@ class TestGerenciadorDeTarefas:
         visualizacao = gerenciador.visualizar_tarefas(mostrar_concluidas=True, mostrar_pendentes=False)
         assert visualizacao == ["Nenhuma tarefa corresponde aos critérios de filtro."]
 
+    def test_marcar_tarefa_como_pendente(self, gerenciador_com_tarefas, capsys):
+        """Testa reabrir uma tarefa concluída."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        tarefa_concluida = tarefas_originais[2]
+
+        assert gerenciador.marcar_tarefa_como_pendente(tarefa_concluida.id) is True
+        assert not tarefa_concluida.concluida
+        assert gerenciador.marcar_tarefa_como_pendente(tarefa_concluida.id) is False
+        captured = capsys.readouterr()
+        assert f"Tarefa '{tarefa_concluida.descricao}' reaberta." in captured.out
+        assert f"Tarefa '{tarefa_concluida.descricao}' já estava pendente." in captured.out
+
+    def test_desfazer_remocao_restaura_posicao(self, gerenciador_com_tarefas):
+        """Testa que desfazer uma remoção devolve a tarefa ao mesmo lugar."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        ids_originais = [t.id for t in gerenciador.tarefas]
+
+        gerenciador.remover_tarefa(tarefas_originais[1].id)
+        assert gerenciador.desfazer() is True
+        assert [t.id for t in gerenciador.tarefas] == ids_originais
+        assert gerenciador.encontrar_tarefa_por_id(tarefas_originais[1].id) is not None
+
+        assert gerenciador.refazer() is True
+        assert gerenciador.encontrar_tarefa_por_id(tarefas_originais[1].id) is None
+
+    def test_desfazer_sequencia_de_operacoes(self, gerenciador_com_tarefas):
+        """Testa desfazer em ordem inversa: conclusão e depois adição."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        tarefa_concluida = tarefas_originais[2]
+
+        assert gerenciador.desfazer() is True # Desfaz a conclusão
+        assert not tarefa_concluida.concluida
+        assert gerenciador.desfazer() is True # Desfaz a adição
+        assert gerenciador.encontrar_tarefa_por_id(tarefa_concluida.id) is None
+
+        # Uma nova operação descarta o que havia para refazer
+        gerenciador.adicionar_tarefa("Nova tarefa")
+        assert gerenciador.refazer() is False
+
+    def test_desfazer_sem_historico(self, gerenciador_vazio, capsys):
+        """Testa desfazer quando não há operações registradas."""
+        assert gerenciador_vazio.desfazer() is False
+        assert "Nenhuma operação para ser desfeita." in capsys.readouterr().out
+
+    def test_historico_persiste_entre_sessoes(self, gerenciador_com_tarefas):
+        """Testa que o histórico é salvo junto ao arquivo de tarefas."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        gerenciador.remover_tarefa(tarefas_originais[0].id)
+
+        novo_gerenciador = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert novo_gerenciador.desfazer() is True
+        assert novo_gerenciador.tarefas[0].id == tarefas_originais[0].id
+
+    def test_desfazer_operacao_que_nao_se_aplica_mantem_historico(self, gerenciador_com_tarefas, capsys):
+        """Testa que uma operação que não corresponde às tarefas não é descartada."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        tamanho_historico = len(gerenciador._desfazer)
+
+        # A tarefa concluída por último some do arquivo fora do gerenciador
+        with open(ARQUIVO_TESTE_JSON, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+        with open(ARQUIVO_TESTE_JSON, "w", encoding="utf-8") as f:
+            json.dump([d for d in dados if d["id"] != tarefas_originais[2].id], f)
+
+        novo_gerenciador = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert novo_gerenciador.desfazer() is False
+        assert "não corresponde às tarefas atuais" in capsys.readouterr().out
+        assert len(novo_gerenciador._desfazer) == tamanho_historico
+        assert len(GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)._desfazer) == tamanho_historico
+
+    def test_desfazer_operacao_desconhecida_mantem_historico(self, gerenciador_com_tarefas, capsys):
+        """Testa que um tipo de operação desconhecido não reabre a tarefa."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        gerenciador._desfazer.append({"op": "arquivar", "id": tarefas_originais[2].id})
+
+        assert gerenciador.desfazer() is False
+        assert "Operação inválida no histórico" in capsys.readouterr().out
+        assert tarefas_originais[2].concluida
+        assert gerenciador._desfazer[-1]["op"] == "arquivar"
+
+    def test_cli_desfazer_com_fragmentos(self, tmp_path):
+        """Testa que 'desfazer' pela linha de comando abre o armazenamento fragmentado."""
+        from main import executar_comando
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3)
+        tarefa = gerenciador.adicionar_tarefa("Tarefa fragmentada")
+
+        # Sem --fragmentos o armazenamento é recusado, em vez de parecer vazio
+        assert executar_comando(["--arquivo", arquivo, "desfazer"]) == 1
+        assert executar_comando(["--arquivo", arquivo, "--fragmentos", "3", "desfazer"]) == 0
+        assert GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3).tarefas == []
+        assert executar_comando(["--arquivo", arquivo, "--fragmentos", "3", "refazer"]) == 0
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3)
+        assert [t.id for t in recarregado.tarefas] == [tarefa.id]
+
+    def test_historico_limitado(self):
+        """Testa que o histórico guarda no máximo limite_historico operações."""
+        remover_arquivos(ARQUIVO_TESTE_JSON)
+        gerenciador = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, limite_historico=2)
+        for i in range(5):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+
+        assert gerenciador.desfazer() is True
+        assert gerenciador.desfazer() is True
+        assert gerenciador.desfazer() is False
+        assert len(gerenciador.tarefas) == 3
+
     # Limpeza final para garantir que o arquivo de teste é removido
     @classmethod
     def teardown_class(cls):
-        if os.path.exists(ARQUIVO_TESTE_JSON):
-            os.remove(ARQUIVO_TESTE_JSON)
+        remover_arquivos(ARQUIVO_TESTE_JSON)
 
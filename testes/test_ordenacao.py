@@ -0,0 +1,109 @@
+# testes/test_ordenacao.py
+
+import pytest
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.ordenacao import interpretar_criterios
+from main import executar_comando
+
+
+@pytest.fixture
+def gerenciador_variado(tmp_path):
+    """Fixture com tarefas de datas, descrições e status variados."""
+    gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+    gerenciador.adicionar_tarefa("banana", "2025-03-01")
+    gerenciador.adicionar_tarefa("Abacaxi")
+    gerenciador.adicionar_tarefa("cereja", "2024-12-31")
+    concluida = gerenciador.adicionar_tarefa("damasco", "2025-01-15")
+    gerenciador.marcar_tarefa_como_concluida(concluida.id)
+    return gerenciador
+
+
+def descricoes(tarefas):
+    return [t.descricao for t in tarefas]
+
+
+class TestOrdenacao:
+    """
+    Conjunto de testes para a ordenação das tarefas.
+    """
+
+    def test_interpretar_criterios(self):
+        """Testa a leitura de campos com direção."""
+        assert interpretar_criterios("vencimento, -status") == [("vencimento", False), ("status", True)]
+        with pytest.raises(ValueError, match="Campo de ordenação inválido"):
+            interpretar_criterios("prioridade")
+
+    def test_ordenar_por_vencimento_sem_data_por_ultimo(self, gerenciador_variado):
+        """Testa a ordem por data, com tarefas sem data no fim."""
+        ordenadas = gerenciador_variado.ordenar_tarefas("vencimento")
+        assert descricoes(ordenadas) == ["cereja", "damasco", "banana", "Abacaxi"]
+
+    def test_ordenar_por_descricao_ignora_maiusculas(self, gerenciador_variado):
+        """Testa a ordem alfabética sem diferenciar maiúsculas."""
+        assert descricoes(gerenciador_variado.ordenar_tarefas("descricao")) == \
+            ["Abacaxi", "banana", "cereja", "damasco"]
+        assert descricoes(gerenciador_variado.ordenar_tarefas("-descricao")) == \
+            ["damasco", "cereja", "banana", "Abacaxi"]
+
+    def test_ordenar_por_varios_campos(self, gerenciador_variado):
+        """Testa status decrescente (concluídas primeiro) e depois vencimento."""
+        ordenadas = gerenciador_variado.ordenar_tarefas(["-status", "vencimento"])
+        assert descricoes(ordenadas) == ["damasco", "cereja", "banana", "Abacaxi"]
+
+    def test_ordenar_por_criacao(self, gerenciador_variado):
+        """Testa a ordem de criação nos dois sentidos."""
+        assert descricoes(gerenciador_variado.ordenar_tarefas("-criacao", limite=2)) == ["damasco", "cereja"]
+        assert descricoes(gerenciador_variado.ordenar_tarefas("criacao")) == \
+            descricoes(gerenciador_variado.tarefas)
+
+    def test_limite_seleciona_os_primeiros(self, gerenciador_variado):
+        """Testa que o top-K por heap coincide com o início da ordenação completa."""
+        completa = gerenciador_variado.ordenar_tarefas("vencimento,descricao")
+        assert gerenciador_variado.ordenar_tarefas("vencimento,descricao", limite=2) == completa[:2]
+
+    def test_chave_atualizada_apos_mudanca_de_status(self, gerenciador_variado):
+        """Testa que reabrir uma tarefa atualiza a chave de status pré-calculada."""
+        assert descricoes(gerenciador_variado.ordenar_tarefas("-status", limite=1)) == ["damasco"]
+        damasco = gerenciador_variado.tarefas[3]
+        gerenciador_variado.marcar_tarefa_como_pendente(damasco.id)
+        gerenciador_variado.marcar_tarefa_como_concluida(gerenciador_variado.tarefas[1].id)
+        assert descricoes(gerenciador_variado.ordenar_tarefas("-status", limite=1)) == ["Abacaxi"]
+
+    def test_visualizar_tarefas_ordenadas_e_filtradas(self, gerenciador_variado):
+        """Testa a listagem com filtro, ordenação e limite."""
+        visualizacao = gerenciador_variado.visualizar_tarefas(
+            mostrar_concluidas=False, ordenar_por="vencimento", limite=2)
+        assert len(visualizacao) == 2
+        assert "Descrição: cereja" in visualizacao[0]
+        assert "Descrição: banana" in visualizacao[1]
+
+    def test_cli_listar_ordenado(self, gerenciador_variado, capsys):
+        """Testa o comando 'listar --ordenar' da linha de comando."""
+        capsys.readouterr()
+        codigo = executar_comando(["--arquivo", gerenciador_variado.arquivo_json,
+                                   "listar", "--ordenar=-vencimento", "--limite", "1"])
+        assert codigo == 0
+        linhas = [l for l in capsys.readouterr().out.splitlines() if l.startswith("ID:")]
+        assert len(linhas) == 1
+        assert "Descrição: banana" in linhas[0]
+
+    def test_cli_listar_criterio_invalido(self, gerenciador_variado, capsys):
+        """Testa que um critério inválido é reportado com código de erro."""
+        codigo = executar_comando(["--arquivo", gerenciador_variado.arquivo_json,
+                                   "listar", "--ordenar", "prioridade"])
+        assert codigo == 1
+        assert "Campo de ordenação inválido" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("limite", [-1, 1.5, True])
+    def test_limite_invalido(self, gerenciador_variado, limite):
+        """Testa que um limite negativo ou não inteiro é recusado."""
+        with pytest.raises(ValueError, match="Limite inválido"):
+            gerenciador_variado.ordenar_tarefas("vencimento", limite=limite)
+        with pytest.raises(ValueError, match="Limite inválido"):
+            gerenciador_variado.visualizar_tarefas(limite=limite)
+
+    def test_cli_listar_limite_negativo(self, gerenciador_variado, capsys):
+        """Testa que o argparse recusa '--limite' negativo."""
+        with pytest.raises(SystemExit):
+            executar_comando(["--arquivo", gerenciador_variado.arquivo_json, "listar", "--limite", "-1"])
+        assert "o limite não pode ser negativo" in capsys.readouterr().err
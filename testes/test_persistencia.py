@@ -0,0 +1,444 @@
+# testes/test_persistencia.py
+
+import json
+import os
+import pytest
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.persistencia import (
+    caminho_do_fragmento,
+    decodificar_tarefas,
+    detectar_formato,
+    FORMATOS,
+    escrever_json,
+    ler_json,
+    recuperar_registros,
+    indice_do_fragmento,
+    refragmentar,
+)
+
+
+class TestFragmentacao:
+    """
+    Conjunto de testes para o armazenamento fragmentado.
+    """
+
+    def test_indice_do_fragmento_e_estavel(self):
+        """Testa que o mesmo ID sempre cai no mesmo fragmento."""
+        indice = indice_do_fragmento("tarefa-123", 4)
+        assert 0 <= indice < 4
+        assert indice_do_fragmento("tarefa-123", 4) == indice
+
+    def test_caminho_do_fragmento(self):
+        """Testa a nomenclatura dos arquivos de fragmento."""
+        assert caminho_do_fragmento("tarefas.json", 3) == "tarefas.3.json"
+
+    def test_salvar_regrava_apenas_fragmento_alterado(self, tmp_path):
+        """Testa que adicionar uma tarefa só regrava o fragmento dela."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4)
+        for i in range(20):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        gerenciador._salvar_tarefas() # Garante que todos os fragmentos existam
+
+        for i in range(4):
+            os.utime(caminho_do_fragmento(arquivo, i), ns=(0, 0))
+
+        nova = gerenciador.adicionar_tarefa("Tarefa nova")
+        alvo = indice_do_fragmento(nova.id, 4)
+        for i in range(4):
+            mtime = os.stat(caminho_do_fragmento(arquivo, i)).st_mtime_ns
+            assert (mtime != 0) == (i == alvo)
+
+    def test_salvar_serializa_apenas_tarefas_do_fragmento(self, tmp_path, monkeypatch):
+        """Testa que salvar uma tarefa não serializa as tarefas dos outros fragmentos."""
+        from gerenciador_tarefas.tarefa import Tarefa
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=8)
+        for i in range(80):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+
+        serializadas = []
+        to_dict_original = Tarefa.to_dict
+        def contar_to_dict(tarefa):
+            serializadas.append(tarefa.id)
+            return to_dict_original(tarefa)
+        monkeypatch.setattr(Tarefa, "to_dict", contar_to_dict)
+
+        nova = gerenciador.adicionar_tarefa("Tarefa nova")
+        alvo = indice_do_fragmento(nova.id, 8)
+        assert nova.id in serializadas
+        assert all(indice_do_fragmento(id_tarefa, 8) == alvo for id_tarefa in serializadas)
+        monkeypatch.undo()
+        assert GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=8).tarefas[-1].id == nova.id
+
+    def test_carregar_fragmentos_preserva_ordem_de_insercao(self, tmp_path):
+        """Testa que a listagem mescla os fragmentos na ordem de inserção."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3)
+        ids = [gerenciador.adicionar_tarefa(f"Tarefa {i}").id for i in range(10)]
+        gerenciador.remover_tarefa(ids[4])
+        del ids[4]
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3)
+        assert [t.id for t in recarregado.tarefas] == ids
+
+        extra = recarregado.adicionar_tarefa("Depois da recarga")
+        assert GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3).tarefas[-1].id == extra.id
+
+    def test_quantidade_de_fragmentos_divergente_e_recusada(self, tmp_path):
+        """Testa que abrir um armazenamento com a quantidade errada não perde tarefas."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3)
+        ids = [gerenciador.adicionar_tarefa(f"Tarefa {i}").id for i in range(30)]
+        with open(f"{arquivo}.fragmentos", encoding="utf-8") as f:
+            assert json.load(f) == {"num_fragmentos": 3}
+
+        for errado in (2, 4, None):
+            with pytest.raises(ValueError, match="3 fragmento"):
+                GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=errado)
+        assert not os.path.exists(arquivo)
+        assert [t.id for t in GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=3).tarefas] == ids
+
+        # Arquivo único aberto como fragmentado
+        unico = str(tmp_path / "unico.json")
+        GerenciadorDeTarefas(arquivo_json=unico).adicionar_tarefa("Tarefa")
+        with pytest.raises(ValueError, match="arquivo único"):
+            GerenciadorDeTarefas(arquivo_json=unico, num_fragmentos=2)
+
+    def test_fragmentos_sem_manifesto_sao_verificados_pelos_arquivos(self, tmp_path):
+        """Testa armazenamentos antigos, anteriores ao manifesto."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4)
+        for i in range(20):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        gerenciador._salvar_tarefas()
+        os.remove(f"{arquivo}.fragmentos")
+
+        with pytest.raises(ValueError, match="pelo menos 4"):
+            GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=2)
+        with pytest.raises(ValueError, match="pelo menos 4"):
+            GerenciadorDeTarefas(arquivo_json=arquivo)
+        reaberto = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4)
+        assert len(reaberto.tarefas) == 20
+        reaberto.adicionar_tarefa("Grava o manifesto")
+        assert os.path.exists(f"{arquivo}.fragmentos")
+
+    def test_registro_no_fragmento_errado_vai_para_quarentena(self, tmp_path):
+        """Testa que um registro cujo ID pertence a outro fragmento é recusado."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=2)
+        tarefas = [gerenciador.adicionar_tarefa(f"Tarefa {i}") for i in range(10)]
+        gerenciador._salvar_tarefas()
+        intrusa = next(t for t in tarefas if indice_do_fragmento(t.id, 2) == 1)
+        caminho = caminho_do_fragmento(arquivo, 0)
+        registros = ler_json(caminho)
+        escrever_json(caminho, registros + [dict(intrusa.to_dict(), ordem=99)])
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=2)
+        assert sorted(t.id for t in recarregado.tarefas) == sorted(t.id for t in tarefas)
+        with open(f"{arquivo}.quarentena", encoding="utf-8") as f:
+            itens = [json.loads(linha) for linha in f]
+        assert [item["registro"]["id"] for item in itens] == [intrusa.id]
+        assert len(ler_json(caminho)) == len(registros)
+
+    @pytest.mark.parametrize("num_fragmentos", [0, -2, 1.5])
+    def test_quantidade_de_fragmentos_invalida(self, tmp_path, num_fragmentos):
+        """Testa que o gerenciador recusa uma quantidade de fragmentos não positiva."""
+        with pytest.raises(ValueError, match="Quantidade de fragmentos inválida"):
+            GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"), num_fragmentos=num_fragmentos)
+
+    def test_refragmentar_ida_e_volta(self, tmp_path):
+        """Testa converter de arquivo único para fragmentos e de volta."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        for i in range(8):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        originais = [t.to_dict() for t in gerenciador.tarefas]
+
+        assert refragmentar(arquivo, None, 4) == 8
+        assert not os.path.exists(arquivo)
+        fragmentado = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4)
+        assert [t.to_dict() for t in fragmentado.tarefas] == originais
+
+        refragmentar(arquivo, 4, 2)
+        assert not os.path.exists(caminho_do_fragmento(arquivo, 3))
+        with open(f"{arquivo}.fragmentos", encoding="utf-8") as f:
+            assert json.load(f) == {"num_fragmentos": 2}
+        refragmentar(arquivo, 2, None)
+        with open(arquivo, "r", encoding="utf-8") as f:
+            assert json.load(f) == originais
+        assert not os.path.exists(f"{arquivo}.fragmentos")
+        assert not [nome for nome in os.listdir(tmp_path) if nome.endswith((".novo", ".antigo"))]
+
+    def test_refragmentar_rejeita_quantidade_negativa(self, tmp_path):
+        """Testa que uma quantidade negativa é recusada sem apagar os arquivos."""
+        arquivo = str(tmp_path / "tarefas.json")
+        GerenciadorDeTarefas(arquivo_json=arquivo).adicionar_tarefa("Tarefa")
+
+        with pytest.raises(ValueError, match="inteiro positivo"):
+            refragmentar(arquivo, None, -2)
+        assert len(ler_json(arquivo)) == 1
+
+    @pytest.mark.parametrize("conteudo", [
+        [{"id": "a", "descricao": "Válida"}, {"descricao": "Sem ID"}],
+        {"id": "a", "descricao": "Não é uma lista"},
+    ])
+    def test_refragmentar_recusa_registros_invalidos(self, tmp_path, conteudo):
+        """Testa que registros inválidos são recusados antes de qualquer gravação."""
+        arquivo = tmp_path / "tarefas.json"
+        arquivo.write_text(json.dumps(conteudo), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="abra o armazenamento no gerenciador"):
+            refragmentar(str(arquivo), None, 2)
+        assert json.loads(arquivo.read_text(encoding="utf-8")) == conteudo
+        assert sorted(os.listdir(tmp_path)) == ["tarefas.json"]
+
+    def test_refragmentar_com_quantidade_atual_errada_falha(self, tmp_path):
+        """Testa que um --de menor que o real é detectado antes de gravar."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4)
+        for i in range(20):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        gerenciador._salvar_tarefas()
+
+        with pytest.raises(ValueError, match="--de"):
+            refragmentar(arquivo, 2, 3)
+        assert len(GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=4).tarefas) == 20
+
+    def test_refragmentar_so_substitui_apos_gravar_tudo(self, tmp_path, monkeypatch):
+        """Testa que uma falha no meio da gravação mantém os arquivos antigos intactos."""
+        import gerenciador_tarefas.persistencia as persistencia
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        for i in range(10):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        originais = ler_json(arquivo)
+
+        gravados = []
+        escrever_original = persistencia.escrever_json
+        def escrever_e_falhar(caminho, *args, **kwargs):
+            if gravados:
+                raise IOError("disco cheio")
+            gravados.append(caminho)
+            escrever_original(caminho, *args, **kwargs)
+        monkeypatch.setattr(persistencia, "escrever_json", escrever_e_falhar)
+
+        with pytest.raises(IOError):
+            refragmentar(arquivo, None, 3)
+        assert ler_json(arquivo) == originais
+        assert not any(os.path.exists(caminho_do_fragmento(arquivo, i)) for i in range(3))
+
+    def test_cli_rejeita_quantidade_negativa(self, tmp_path, capsys):
+        """Testa que --para negativo é recusado pelo parser."""
+        from main import executar_comando
+        with pytest.raises(SystemExit):
+            executar_comando(["--arquivo", str(tmp_path / "tarefas.json"),
+                              "refragmentar", "--para", "-1"])
+        assert "negativa" in capsys.readouterr().err
+
+
+class TestCargaTolerante:
+    """
+    Conjunto de testes para a validação individual dos registros.
+    """
+
+    def test_decodificar_preserva_ordem_e_erros(self):
+        """Testa que a validação mantém a ordem e reporta cada erro."""
+        registros = [{"id": f"id-{i}", "descricao": f"Tarefa {i}"} for i in range(25)]
+        registros[7] = {"descricao": "Sem ID"}
+        registros[18] = "não é um dict"
+
+        validos, erros = decodificar_tarefas(registros)
+        assert [posicao for posicao, _ in validos] == [i for i in range(25) if i not in (7, 18)]
+        assert [t.id for _, t in validos][:3] == ["id-0", "id-1", "id-2"]
+        assert [posicao for posicao, _ in erros] == [7, 18]
+        assert "KeyError" in erros[0][1]
+
+    def test_decodificar_conteudo_que_nao_e_lista(self):
+        """Testa que um arquivo cujo conteúdo não é uma lista é rejeitado."""
+        with pytest.raises(ValueError, match="lista de tarefas"):
+            decodificar_tarefas({"id": "x"})
+
+    @pytest.mark.parametrize("num_fragmentos", [None, 2])
+    def test_ordem_invalida_nao_impede_a_carga(self, tmp_path, num_fragmentos):
+        """Testa que um campo "ordem" adulterado não impede abrir o arquivo."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=num_fragmentos)
+        for i in range(6):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        gerenciador._salvar_tarefas()
+        caminhos = ([caminho_do_fragmento(arquivo, i) for i in range(2)] if num_fragmentos else [arquivo])
+        for caminho in caminhos:
+            escrever_json(caminho, [dict(r, ordem="z") for r in ler_json(caminho)])
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=num_fragmentos)
+        assert len(recarregado.tarefas) == 6
+        extra = recarregado.adicionar_tarefa("Depois")
+        assert recarregado.ordenar_tarefas("criacao")[-1] is extra
+
+    def test_registro_invalido_nao_descarta_demais_tarefas(self, tmp_path, capsys):
+        """Testa que o gerenciador ignora só o registro inválido ao carregar."""
+        arquivo = tmp_path / "tarefas.json"
+        arquivo.write_text(json.dumps([
+            {"id": "a", "descricao": "Válida A"},
+            {"id": "b", "descricao": ""},
+            {"id": "c", "descricao": "Válida C"},
+        ]), encoding="utf-8")
+
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(arquivo))
+        assert [t.id for t in gerenciador.tarefas] == ["a", "c"]
+        assert [posicao for posicao, _ in gerenciador.erros_de_carga] == [1]
+        assert "Registro 1 do arquivo" in capsys.readouterr().out
+
+
+class TestRecuperacao:
+    """
+    Conjunto de testes para a recuperação de arquivos corrompidos.
+    """
+
+    def test_recuperar_registros_salta_trecho_corrompido(self):
+        """Testa que registros antes e depois do dano são recuperados."""
+        texto = json.dumps([{"id": str(i), "descricao": f"T{i}"} for i in range(5)], indent=4)
+        inicio = texto.index('"2"')
+        texto = texto[:inicio] + "#@!lixo" + texto[inicio + 3:]
+
+        registros, corrompidos = recuperar_registros(texto)
+        assert [r["id"] for r in registros] == ["0", "1", "3", "4"]
+        assert len(corrompidos) == 1
+
+    def test_recuperar_registros_arquivo_truncado(self):
+        """Testa que um arquivo truncado no meio de um registro mantém os anteriores."""
+        texto = json.dumps([{"id": str(i), "descricao": f"T{i}"} for i in range(3)], indent=4)
+        registros, corrompidos = recuperar_registros(texto[:-20])
+        assert [r["id"] for r in registros] == ["0", "1"]
+        assert len(corrompidos) == 1
+
+    def test_escrever_json_rotaciona_copias(self, tmp_path):
+        """Testa que as versões anteriores são mantidas até o limite de cópias."""
+        arquivo = str(tmp_path / "tarefas.json")
+        for versao in range(4):
+            escrever_json(arquivo, [versao], copias=2)
+
+        with open(arquivo, encoding="utf-8") as f:
+            assert json.load(f) == [3]
+        with open(f"{arquivo}.1", encoding="utf-8") as f:
+            assert json.load(f) == [2]
+        with open(f"{arquivo}.2", encoding="utf-8") as f:
+            assert json.load(f) == [1]
+        assert not os.path.exists(f"{arquivo}.3")
+
+    def test_gerenciador_recupera_e_coloca_em_quarentena(self, tmp_path):
+        """Testa que o gerenciador mantém as tarefas válidas e isola o restante."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        ids = [gerenciador.adicionar_tarefa(f"Tarefa {i}").id for i in range(4)]
+        with open(arquivo, encoding="utf-8") as f:
+            original = f.read()
+        danificado = original.replace(f'"id": "{ids[1]}"', '"id": ???', 1)
+        danificado = danificado.replace('"descricao": "Tarefa 2"', '"descricao": ""', 1)
+        with open(arquivo, "w", encoding="utf-8") as f:
+            f.write(danificado)
+
+        recuperado = GerenciadorDeTarefas(arquivo_json=arquivo)
+        assert [t.id for t in recuperado.tarefas] == [ids[0], ids[3]]
+
+        with open(f"{arquivo}.quarentena", encoding="utf-8") as f:
+            itens = [json.loads(linha) for linha in f]
+        assert len(itens) == 2
+        assert itens[1]["registro"]["id"] == ids[2]
+
+        # O arquivo danificado é preservado como cópia de segurança
+        with open(f"{arquivo}.1", encoding="utf-8") as f:
+            assert f.read() == danificado
+
+
+class TestCompressao:
+    """
+    Conjunto de testes para os formatos comprimidos.
+    """
+
+    @pytest.mark.parametrize("formato", FORMATOS)
+    def test_gerenciador_salva_e_carrega_em_cada_formato(self, tmp_path, formato):
+        """Testa que cada formato preserva as tarefas ao recarregar."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, formato=formato)
+        for i in range(30):
+            gerenciador.adicionar_tarefa(f"Tarefa repetitiva {i}", "2025-01-01")
+        originais = [t.to_dict() for t in gerenciador.tarefas]
+
+        # A leitura detecta o formato, mesmo sem informá-lo
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo)
+        assert [t.to_dict() for t in recarregado.tarefas] == originais
+        assert ler_json(arquivo) == originais
+
+    @pytest.mark.parametrize("formato", ["gzip", "zlib", "lzma"])
+    def test_formatos_comprimidos_reduzem_tamanho(self, tmp_path, formato):
+        """Testa que os formatos comprimidos ocupam menos que o JSON indentado."""
+        dados = [{"id": str(i), "descricao": "Tarefa", "data_vencimento": None, "concluida": False}
+                 for i in range(200)]
+        escrever_json(str(tmp_path / "puro.json"), dados)
+        escrever_json(str(tmp_path / "comprimido.json"), dados, formato=formato)
+        assert (tmp_path / "comprimido.json").stat().st_size < (tmp_path / "puro.json").stat().st_size / 4
+
+    def test_arquivo_comprimido_truncado_recupera_inicio(self, tmp_path):
+        """Testa que um gzip truncado ainda fornece os registros já descomprimidos."""
+        arquivo = tmp_path / "tarefas.json"
+        dados = [{"id": f"id-{i}", "descricao": f"Tarefa {i} " + "x" * (i % 50)} for i in range(2000)]
+        escrever_json(str(arquivo), dados, formato="gzip")
+        bruto = arquivo.read_bytes()
+        arquivo.write_bytes(bruto[:len(bruto) // 2])
+
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(arquivo))
+        ids = [t.id for t in gerenciador.tarefas]
+        assert 0 < len(ids) < 2000
+        assert ids == [f"id-{i}" for i in range(len(ids))]
+        assert (tmp_path / "tarefas.json.quarentena").exists()
+
+    def test_formato_invalido_levanta_erro(self, tmp_path):
+        """Testa que um formato desconhecido é rejeitado na criação do gerenciador."""
+        with pytest.raises(ValueError, match="Formato inválido"):
+            GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"), formato="bzip3")
+
+    @pytest.mark.parametrize("num_fragmentos", [None, 3])
+    def test_gerenciador_mantem_formato_do_arquivo(self, tmp_path, num_fragmentos):
+        """Testa que abrir um arquivo comprimido sem informar o formato não o converte."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=num_fragmentos,
+                                           formato="lzma")
+        for i in range(6):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+        gerenciador._salvar_tarefas()
+
+        reaberto = GerenciadorDeTarefas(arquivo_json=arquivo, num_fragmentos=num_fragmentos)
+        assert reaberto.formato == "lzma"
+        reaberto.adicionar_tarefa("Outra")
+        caminhos = ([caminho_do_fragmento(arquivo, i) for i in range(3)] if num_fragmentos else [arquivo])
+        assert {detectar_formato(caminho) for caminho in caminhos} == {"lzma"}
+
+    def test_gerenciador_sem_arquivo_usa_json(self, tmp_path):
+        """Testa que um arquivo novo é gravado em JSON quando o formato não é informado."""
+        assert GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json")).formato == "json"
+
+    def test_cli_desfazer_mantem_formato(self, tmp_path):
+        """Testa que desfazer pela linha de comando não descomprime o arquivo."""
+        from main import executar_comando
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, formato="gzip")
+        gerenciador.adicionar_tarefa("A")
+        gerenciador.adicionar_tarefa("B")
+
+        assert executar_comando(["--arquivo", arquivo, "desfazer"]) == 0
+        assert detectar_formato(arquivo) == "gzip"
+        assert executar_comando(["--arquivo", arquivo, "--formato", "zlib", "refazer"]) == 0
+        assert detectar_formato(arquivo) == "zlib"
+        assert [r["descricao"] for r in ler_json(arquivo)] == ["A", "B"]
+
+    def test_refragmentar_mantem_formato(self, tmp_path):
+        """Testa que refragmentar sem --formato grava os fragmentos no formato atual."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, formato="gzip")
+        for i in range(6):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+
+        refragmentar(arquivo, None, 2)
+        assert {detectar_formato(caminho_do_fragmento(arquivo, i)) for i in range(2)} == {"gzip"}
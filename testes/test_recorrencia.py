@@ -0,0 +1,207 @@
+# testes/test_recorrencia.py
+
+import json
+import pytest
+from datetime import date
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.recorrencia import RegraDeRecorrencia
+
+
+class TestRegraDeRecorrencia:
+    """
+    Conjunto de testes para a classe RegraDeRecorrencia.
+    """
+
+    def test_ocorrencias_semanais_na_janela(self):
+        """Testa que só as ocorrências dentro do intervalo são geradas."""
+        regra = RegraDeRecorrencia("Reunião semanal", "2025-01-06", "semanal")
+        datas = list(regra.ocorrencias("2025-01-10", "2025-01-31"))
+        assert datas == [date(2025, 1, 13), date(2025, 1, 20), date(2025, 1, 27)]
+
+    def test_ocorrencias_diarias_com_intervalo_e_fim(self):
+        """Testa o intervalo entre ocorrências e a data final da regra."""
+        regra = RegraDeRecorrencia("Regar plantas", "2025-01-01", "diaria", intervalo=3, data_fim="2025-01-10")
+        assert [d.day for d in regra.ocorrencias("2025-01-01", "2025-12-31")] == [1, 4, 7, 10]
+
+    def test_ocorrencias_mensais_ajustam_fim_do_mes(self):
+        """Testa que o dia 31 vira o último dia dos meses mais curtos."""
+        regra = RegraDeRecorrencia("Fechar o mês", "2024-01-31", "mensal")
+        datas = list(regra.ocorrencias("2024-02-01", "2024-04-30"))
+        assert datas == [date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]
+
+    def test_janela_distante_nao_percorre_a_serie(self):
+        """Testa uma janela décadas após o início sem gerar as ocorrências anteriores."""
+        regra = RegraDeRecorrencia("Backup", "2000-01-01", "diaria")
+        assert regra._primeiro_indice_a_partir_de(date(2080, 1, 1)) > 29000
+        assert list(regra.ocorrencias("2080-01-01", "2080-01-02")) == [date(2080, 1, 1), date(2080, 1, 2)]
+
+    @pytest.mark.parametrize("frequencia, inicio, janela, quantidade", [
+        ("semanal", "2025-01-06", ("9999-12-01", "9999-12-31"), 4),
+        ("diaria", "9999-12-30", ("9999-12-01", "9999-12-31"), 2),
+        ("mensal", "2025-01-31", ("9999-01-01", "9999-12-31"), 12),
+    ])
+    def test_janela_ate_a_ultima_data_valida(self, frequencia, inicio, janela, quantidade):
+        """Testa que a série termina em vez de estourar depois de 9999-12-31."""
+        regra = RegraDeRecorrencia("Sem fim", inicio, frequencia)
+        datas = list(regra.ocorrencias(*janela))
+        assert len(datas) == quantidade
+        assert datas[-1] <= date.max
+
+    def test_parametros_invalidos_levantam_erro(self):
+        """Testa a validação de frequência, intervalo e datas."""
+        with pytest.raises(ValueError, match="Frequência inválida"):
+            RegraDeRecorrencia("X", "2025-01-01", "anual")
+        with pytest.raises(ValueError, match="intervalo"):
+            RegraDeRecorrencia("X", "2025-01-01", "diaria", intervalo=0)
+        with pytest.raises(ValueError, match="Data inválida"):
+            RegraDeRecorrencia("X", "01/01/2025", "diaria")
+        with pytest.raises(ValueError, match="data final"):
+            RegraDeRecorrencia("X", "2025-01-10", "diaria", data_fim="2025-01-01")
+
+    def test_to_dict_e_from_dict(self):
+        """Testa a serialização da regra, incluindo as ocorrências concluídas."""
+        regra = RegraDeRecorrencia("Relatório", "2025-01-01", "mensal", intervalo=2,
+                                   data_fim="2025-12-31", concluidas=["2025-03-01"])
+        copia = RegraDeRecorrencia.from_dict(regra.to_dict())
+        assert copia.to_dict() == regra.to_dict()
+
+
+class TestRecorrenciasNoGerenciador:
+    """
+    Conjunto de testes para as recorrências no GerenciadorDeTarefas.
+    """
+
+    def test_recorrencia_nao_ocupa_o_arquivo_de_tarefas(self, tmp_path):
+        """Testa que a regra é salva à parte e gera tarefas sob demanda."""
+        arquivo = tmp_path / "tarefas.json"
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(arquivo))
+        gerenciador.adicionar_tarefa("Tarefa comum")
+        regra = gerenciador.adicionar_recorrencia("Relatório semanal", "2025-01-06", "semanal")
+
+        assert len(json.loads(arquivo.read_text(encoding="utf-8"))) == 1
+        tarefas = gerenciador.tarefas_recorrentes_entre("2025-01-01", "2025-01-31")
+        assert [t.data_vencimento for t in tarefas] == ["2025-01-06", "2025-01-13", "2025-01-20", "2025-01-27"]
+        assert tarefas[0].id == f"{regra.id}@2025-01-06"
+        assert len(gerenciador.tarefas) == 1
+
+    def test_tarefas_de_varias_regras_em_ordem_de_data(self, tmp_path):
+        """Testa a mescla das ocorrências de várias regras por data."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        gerenciador.adicionar_recorrencia("Semanal", "2025-01-02", "semanal")
+        gerenciador.adicionar_recorrencia("Mensal", "2025-01-05", "mensal")
+        tarefas = gerenciador.tarefas_recorrentes_entre("2025-01-01", "2025-01-10")
+        assert [(t.descricao, t.data_vencimento) for t in tarefas] == [
+            ("Semanal", "2025-01-02"), ("Mensal", "2025-01-05"), ("Semanal", "2025-01-09")]
+
+    def test_concluir_ocorrencia_persiste(self, tmp_path):
+        """Testa que concluir uma ocorrência afeta só ela e sobrevive à recarga."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        regra = gerenciador.adicionar_recorrencia("Diária", "2025-01-01", "diaria")
+
+        assert gerenciador.marcar_ocorrencia_como_concluida(f"{regra.id}@2025-01-02") is True
+        assert gerenciador.marcar_ocorrencia_como_concluida(f"{regra.id}@2025-01-02") is False
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=arquivo)
+        status = [t.concluida for t in recarregado.tarefas_recorrentes_entre("2025-01-01", "2025-01-03")]
+        assert status == [False, True, False]
+
+        assert recarregado.marcar_ocorrencia_como_concluida(f"{regra.id}@2025-01-02", concluida=False) is True
+        assert recarregado.recorrencias[regra.id].concluidas == set()
+
+    def test_concluir_ocorrencia_inexistente(self, tmp_path, capsys):
+        """Testa IDs de ocorrência com regra ou data inválidas."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        regra = gerenciador.adicionar_recorrencia("Semanal", "2025-01-06", "semanal")
+
+        assert gerenciador.marcar_ocorrencia_como_concluida(f"{regra.id}@2025-01-07") is False
+        assert gerenciador.marcar_ocorrencia_como_concluida(f"{regra.id}@amanhã") is False
+        assert gerenciador.marcar_ocorrencia_como_concluida("regra-fantasma@2025-01-06") is False
+        assert "não encontrada" in capsys.readouterr().out
+
+    def test_concluir_ocorrencia_publica_evento_e_pode_ser_desfeita(self, tmp_path):
+        """Testa o evento da conclusão de uma ocorrência e o desfazer/refazer."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        regra = gerenciador.adicionar_recorrencia("Diária", "2025-01-01", "diaria")
+        id_ocorrencia = f"{regra.id}@2025-01-02"
+        eventos = []
+        gerenciador.alteracoes.assinar(eventos.append)
+
+        gerenciador.marcar_ocorrencia_como_concluida(id_ocorrencia)
+        assert [(e["tipo"], e["tarefa"]["id"], e["tarefa"]["concluida"]) for e in eventos] == [
+            ("concluida", id_ocorrencia, True)]
+
+        assert gerenciador.desfazer() is True
+        assert GerenciadorDeTarefas(arquivo_json=arquivo).recorrencias[regra.id].concluidas == set()
+        assert gerenciador.refazer() is True
+        assert gerenciador.recorrencias[regra.id].concluidas == {"2025-01-02"}
+        assert [e["tipo"] for e in eventos] == ["concluida", "reaberta", "concluida"]
+
+        gerenciador.remover_recorrencia(regra.id)
+        assert gerenciador.desfazer() is False
+        assert len(gerenciador._desfazer) == 1
+
+    def test_intervalo_sem_ocorrencias(self, tmp_path):
+        """Testa a mensagem de filtro quando há regras, mas nenhuma ocorrência no intervalo."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        assert gerenciador.visualizar_tarefas(inicio="2025-01-01", fim="2025-01-31") == [
+            "Nenhuma tarefa cadastrada."]
+        gerenciador.adicionar_recorrencia("Mensal", "2025-03-01", "mensal")
+        assert gerenciador.visualizar_tarefas(inicio="2025-01-01", fim="2025-01-31") == [
+            "Nenhuma tarefa corresponde aos critérios de filtro."]
+
+    def test_adicionar_e_remover_recorrencia(self, tmp_path, capsys):
+        """Testa parâmetros inválidos e a remoção de uma regra."""
+        arquivo = str(tmp_path / "tarefas.json")
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo)
+        assert gerenciador.adicionar_recorrencia("Inválida", "2025-01-01", "anual") is None
+        assert "Erro ao criar recorrência" in capsys.readouterr().out
+
+        regra = gerenciador.adicionar_recorrencia("Temporária", "2025-01-01", "diaria")
+        assert gerenciador.remover_recorrencia(regra.id) is True
+        assert gerenciador.remover_recorrencia(regra.id) is False
+        assert GerenciadorDeTarefas(arquivo_json=arquivo).recorrencias == {}
+
+    def test_visualizar_intervalo_inclui_ocorrencias(self, tmp_path):
+        """Testa a listagem por intervalo com tarefas comuns e ocorrências."""
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+        gerenciador.adicionar_tarefa("Comum no intervalo", "2025-01-08")
+        gerenciador.adicionar_tarefa("Comum fora", "2025-02-01")
+        gerenciador.adicionar_tarefa("Sem data")
+        regra = gerenciador.adicionar_recorrencia("Semanal", "2025-01-06", "semanal")
+        gerenciador.marcar_ocorrencia_como_concluida(f"{regra.id}@2025-01-13")
+
+        linhas = gerenciador.visualizar_tarefas(inicio="2025-01-01", fim="2025-01-15")
+        assert ["Comum no intervalo" in l or "Semanal" in l for l in linhas] == [True] * 3
+        assert "2025-01-06" in linhas[0] and "2025-01-08" in linhas[1] and "2025-01-13" in linhas[2]
+
+        pendentes = gerenciador.visualizar_tarefas(mostrar_concluidas=False, ordenar_por="-vencimento",
+                                                   inicio="2025-01-01", fim="2025-01-15")
+        assert len(pendentes) == 2 and "Comum no intervalo" in pendentes[0]
+        assert gerenciador._chaves_ordenacao.keys() <= {t.id for t in gerenciador.tarefas}
+
+        with pytest.raises(ValueError, match="início e o fim"):
+            gerenciador.visualizar_tarefas(inicio="2025-01-01")
+
+    def test_cli_recorrencias(self, tmp_path, capsys):
+        """Testa adicionar uma recorrência, listar o intervalo e concluir uma ocorrência."""
+        from main import executar_comando
+        arquivo = str(tmp_path / "tarefas.json")
+        assert executar_comando(["--arquivo", arquivo, "adicionar-recorrencia", "Backup",
+                                 "--inicio", "2025-03-01", "--frequencia", "diaria",
+                                 "--intervalo", "2"]) == 0
+        id_regra = capsys.readouterr().out.split("ID da recorrência: ")[1].strip()
+
+        assert executar_comando(["--arquivo", arquivo, "listar", "--de", "2025-03-01",
+                                 "--ate", "2025-03-05"]) == 0
+        linhas = [l for l in capsys.readouterr().out.splitlines() if l.startswith("ID:")]
+        assert [l.split()[1] for l in linhas] == [f"{id_regra}@2025-03-0{d}" for d in (1, 3, 5)]
+
+        assert executar_comando(["--arquivo", arquivo, "concluir-ocorrencia", f"{id_regra}@2025-03-03"]) == 0
+        assert executar_comando(["--arquivo", arquivo, "concluir-ocorrencia", f"{id_regra}@2025-03-04"]) == 1
+        assert GerenciadorDeTarefas(arquivo_json=arquivo).recorrencias[id_regra].concluidas == {"2025-03-03"}
+
+        assert executar_comando(["--arquivo", arquivo, "adicionar-recorrencia", "Ruim",
+                                 "--inicio", "2025-13-01", "--frequencia", "diaria"]) == 1
+        assert executar_comando(["--arquivo", arquivo, "remover-recorrencia", id_regra]) == 0